@@ -13,15 +13,152 @@ Checks:
   - Optionally tests PSSH challenge generation
 """
 
+import argparse
 import sys
 import hashlib
+import pickle
 from pathlib import Path
 
+try:
+    from pywidevine.device import Device
+except ImportError:
+    Device = None
 
-def check_device(wvd_path, test_pssh=None):
+
+def _pb_read_varint(buf, pos):
+    """Read one protobuf varint at pos. Returns (value, next_pos)."""
+    result = shift = 0
+    while True:
+        b = buf[pos]
+        pos += 1
+        result |= (b & 0x7F) << shift
+        if not b & 0x80:
+            return result, pos
+        shift += 7
+
+
+def _pb_field(buf, field_num):
+    """Return the first length-delimited occurrence of `field_num`.
+
+    Walks the message's tag/length framing directly, skipping fields we
+    don't care about — no protobuf schema or message allocation needed.
+    Returns None if the field isn't present.
+    """
+    pos = 0
+    end = len(buf)
+    while pos < end:
+        tag, pos = _pb_read_varint(buf, pos)
+        fn, wire = tag >> 3, tag & 7
+        if wire == 0:  # varint
+            _, pos = _pb_read_varint(buf, pos)
+        elif wire == 1:  # fixed64
+            pos += 8
+        elif wire == 2:  # length-delimited
+            length, pos = _pb_read_varint(buf, pos)
+            if fn == field_num:
+                return buf[pos:pos + length]
+            pos += length
+        elif wire == 5:  # fixed32
+            pos += 4
+        else:
+            raise ValueError(f"unsupported wire type {wire}")
+    return None
+
+
+def _der_read_tlv(buf, pos):
+    """Read one DER TLV at pos. Returns (tag, value_start, value_end)."""
+    tag = buf[pos]
+    length = buf[pos + 1]
+    pos += 2
+    if length & 0x80:
+        n_len = length & 0x7F
+        length = int.from_bytes(buf[pos:pos + n_len], "big")
+        pos += n_len
+    return tag, pos, pos + length
+
+
+def _der_rsa_modulus(der):
+    """Extract the RSA modulus from a DER SubjectPublicKeyInfo or RSAPublicKey.
+
+    Only walks the handful of TLV headers needed to reach the modulus
+    INTEGER — far cheaper than a full RSA.import_key, which validates and
+    reconstructs the whole key just so we can read .n.
+    """
+    tag, pos, end = _der_read_tlv(der, 0)
+    if tag != 0x30:  # outer SEQUENCE
+        raise ValueError("not a DER SEQUENCE")
+    tag, inner_start, inner_end = _der_read_tlv(der, pos)
+    if tag == 0x30:
+        # SPKI: skip AlgorithmIdentifier, unwrap the BIT STRING
+        tag, bs_start, bs_end = _der_read_tlv(der, inner_end)
+        if tag != 0x03:
+            raise ValueError("expected BIT STRING")
+        # skip unused-bits octet, then the RSAPublicKey SEQUENCE
+        tag, pos, end = _der_read_tlv(der, bs_start + 1)
+        if tag != 0x30:
+            raise ValueError("expected RSAPublicKey SEQUENCE")
+        tag, n_start, n_end = _der_read_tlv(der, pos)
+    else:
+        # bare RSAPublicKey: first INTEGER is the modulus
+        n_start, n_end = inner_start, inner_end
+    if tag != 0x02:
+        raise ValueError("expected INTEGER modulus")
+    return int.from_bytes(der[n_start:n_end], "big")
+
+
+# Cdm.from_device re-derives RSA Montgomery/CRT constants each call, so
+# reuse one Cdm per device. Device isn't hashable: key on identity and
+# keep a strong ref so the id can't be recycled.
+_CDM_CACHE = {}
+
+
+def _get_cdm(device):
+    """Memoized Cdm.from_device for repeated challenge generation."""
+    entry = _CDM_CACHE.get(id(device))
+    if entry is None or entry[0] is not device:
+        from pywidevine.cdm import Cdm
+        entry = (device, Cdm.from_device(device))
+        _CDM_CACHE[id(device)] = entry
+    return entry[1]
+
+
+def _print_key_match(key_modulus, cert_modulus):
+    """Report the key-vs-certificate modulus comparison."""
+    if cert_modulus:
+        match = key_modulus == cert_modulus
+        print(f"  Key Match: {'YES - Key and certificate match' if match else 'NO - MISMATCH!'}")
+        if not match:
+            print(f"  WARNING: Private key does not match client ID certificate!")
+            print(f"  This will cause INVALID_SIGNATURE errors from license servers.")
+            print(f"  Re-extract both key and client ID from the SAME session.")
+    else:
+        # Fallback: just show key fingerprint
+        # Truncate the binary digest before hex-encoding — hexdigest()
+        # would encode all 32 bytes only for the slice to drop 48 chars.
+        # Size the buffer to the actual modulus width: a fixed 256 bytes
+        # hashed up to 128 leading zeros for smaller keys.
+        nbytes = (key_modulus.bit_length() + 7) // 8
+        key_fp = hashlib.sha256(
+            key_modulus.to_bytes(nbytes, 'big')
+        ).digest()[:8].hex()
+        print(f"  Key FP   : {key_fp}...")
+        print(f"  Key Match: Could not verify (cert format not recognized)")
+
+
+def _load_cache(cache_path, wvd_sha):
+    """Load the sidecar cache if it matches the current wvd bytes."""
     try:
-        from pywidevine.device import Device
-    except ImportError:
+        with open(cache_path, "rb") as f:
+            cached = pickle.load(f)
+        if cached.get("sha256") == wvd_sha:
+            return cached
+    except Exception:
+        pass
+    return None
+
+
+def check_device(wvd_path, test_pssh=None):
+    if Device is None:
         print("ERROR: pywidevine required. Install: pip install pywidevine")
         sys.exit(1)
 
@@ -30,9 +167,27 @@ def check_device(wvd_path, test_pssh=None):
         print(f"ERROR: File not found: {wvd_path}")
         sys.exit(1)
 
-    print(f"\n  Checking: {wvd_path} ({path.stat().st_size} bytes)")
+    wvd_bytes = path.read_bytes()
+    wvd_sha = hashlib.sha256(wvd_bytes).hexdigest()
+    cache_path = path.with_suffix(".wvd.cache")
+
+    print(f"\n  Checking: {wvd_path} ({len(wvd_bytes)} bytes)")
     print(f"  {'─' * 45}")
 
+    # Cached fast path: skip protobuf parse and RSA key import entirely.
+    # --test-pssh needs the real Device, so it always takes the full path.
+    if not test_pssh:
+        cached = _load_cache(cache_path, wvd_sha)
+        if cached:
+            print(f"  Load     : OK (cached)")
+            print(f"  System ID: {cached['system_id']}")
+            print(f"  Security : L{cached['security_level']}")
+            print(f"  Type     : {cached['type']}")
+            print(f"  Key bits : {cached['key_bits']}")
+            _print_key_match(cached["key_modulus"], cached["cert_modulus"])
+            print()
+            return
+
     # Load device
     try:
         device = Device.load(str(path))
@@ -48,6 +203,7 @@ def check_device(wvd_path, test_pssh=None):
     print(f"  Key bits : {device.private_key.size_in_bits()}")
 
     # Key-cert modulus match check
+    key_modulus = cert_modulus = None
     try:
         from pywidevine.license_protocol_pb2 import SignedMessage, ClientIdentification
         from Crypto.PublicKey import RSA
@@ -56,71 +212,118 @@ def check_device(wvd_path, test_pssh=None):
         key_modulus = device.private_key.n
 
         # Extract cert modulus from client ID
-        client_id = ClientIdentification()
-        client_id.ParseFromString(device.client_id.SerializeToString()
-                                  if hasattr(device.client_id, 'SerializeToString')
-                                  else device.client_id)
+        # device.client_id is already a parsed ClientIdentification;
+        # only raw bytes (older pywidevine) need an actual parse.
+        if isinstance(device.client_id, ClientIdentification):
+            client_id = device.client_id
+        else:
+            client_id = ClientIdentification.FromString(device.client_id)
 
         # Try to get the DRM certificate from token
-        cert_modulus = None
         if hasattr(client_id, 'token'):
             try:
-                signed = SignedMessage()
-                signed.ParseFromString(client_id.token)
-                cert = RSA.import_key(signed.msg)
-                cert_modulus = cert.n
+                token = bytes(client_id.token)
+                try:
+                    # SignedMessage.msg is field 2, wire type 2 (field 1
+                    # is the type varint) — grab it with a raw TLV walk,
+                    # no full protobuf parse
+                    msg = _pb_field(token, 2)
+                except ValueError:
+                    msg = None
+                if msg is None:
+                    signed = SignedMessage()
+                    signed.ParseFromString(token)
+                    msg = signed.msg
+                try:
+                    # Cheap path: pull only the modulus out of the DER
+                    cert_modulus = _der_rsa_modulus(msg)
+                except ValueError:
+                    # Unrecognized layout — let PyCryptodome handle it
+                    cert_modulus = RSA.import_key(msg).n
             except Exception:
                 pass
 
-        if cert_modulus:
-            match = key_modulus == cert_modulus
-            print(f"  Key Match: {'YES - Key and certificate match' if match else 'NO - MISMATCH!'}")
-            if not match:
-                print(f"  WARNING: Private key does not match client ID certificate!")
-                print(f"  This will cause INVALID_SIGNATURE errors from license servers.")
-                print(f"  Re-extract both key and client ID from the SAME session.")
-        else:
-            # Fallback: just show key fingerprint
-            key_fp = hashlib.sha256(
-                device.private_key.n.to_bytes(256, 'big')
-            ).hexdigest()[:16]
-            print(f"  Key FP   : {key_fp}...")
-            print(f"  Key Match: Could not verify (cert format not recognized)")
+        _print_key_match(key_modulus, cert_modulus)
 
     except Exception as e:
         print(f"  Key Match: Could not verify ({e})")
 
-    # Test PSSH challenge generation
+    # Refresh the sidecar cache for the next run
+    if key_modulus is not None:
+        try:
+            with open(cache_path, "wb") as f:
+                pickle.dump({
+                    "sha256": wvd_sha,
+                    "system_id": device.system_id,
+                    "security_level": device.security_level,
+                    "type": str(device.type),
+                    "key_bits": device.private_key.size_in_bits(),
+                    "key_modulus": key_modulus,
+                    "cert_modulus": cert_modulus,
+                }, f)
+        except OSError:
+            pass
+
+    # Test PSSH challenge generation — one CDM session for all PSSHs
     if test_pssh:
+        psshs = [test_pssh] if isinstance(test_pssh, str) else list(test_pssh)
         try:
-            from pywidevine.cdm import Cdm
             from pywidevine.pssh import PSSH
 
-            cdm = Cdm.from_device(device)
+            cdm = _get_cdm(device)
             sid = cdm.open()
-            pssh = PSSH(test_pssh)
-            challenge = cdm.get_license_challenge(sid, pssh)
-            cdm.close(sid)
-            print(f"  Challenge: OK ({len(challenge)} bytes)")
+            try:
+                for p in psshs:
+                    challenge = cdm.get_license_challenge(sid, PSSH(p))
+                    print(f"  Challenge: OK ({len(challenge)} bytes)")
+            finally:
+                cdm.close(sid)
         except Exception as e:
             print(f"  Challenge: FAILED - {e}")
 
     print()
 
 
+def _check_one(wvd_path, test_pssh=None):
+    """Run check_device with stdout captured. Picklable pool worker."""
+    import io
+    import contextlib
+
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        try:
+            check_device(wvd_path, test_pssh)
+        except SystemExit:
+            pass
+    return buf.getvalue()
+
+
 def main():
-    import argparse
+    import functools
+    import os
+    from concurrent.futures import ProcessPoolExecutor
 
     parser = argparse.ArgumentParser(
         description="Verify a Widevine .wvd device file"
     )
-    parser.add_argument("wvd", help="Path to .wvd file")
+    parser.add_argument("wvd", nargs="+", help="Path(s) to .wvd file(s)")
     parser.add_argument(
-        "--test-pssh", help="Optional PSSH (base64) to test challenge generation"
+        "--test-pssh", nargs="+",
+        help="Optional PSSH(s) (base64) to test challenge generation"
     )
     args = parser.parse_args()
 
-    check_device(args.wvd, args.test_pssh)
+    if len(args.wvd) == 1:
+        check_device(args.wvd[0], args.test_pssh)
+        return
+
+    # Each check is independent and CPU-bound (protobuf parse + RSA key
+    # import), so fan out across processes and print in input order.
+    workers = min(len(args.wvd), os.cpu_count() or 1)
+    check = functools.partial(_check_one, test_pssh=args.test_pssh)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for report in pool.map(check, args.wvd):
+            print(report, end="")
 
 
 if __name__ == "__main__":
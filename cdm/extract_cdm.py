@@ -25,6 +25,8 @@ Requirements:
   - pywidevine: pip install pywidevine
 """
 
+import argparse
+import functools
 import os
 import sys
 import shutil
@@ -34,29 +36,65 @@ from pathlib import Path
 
 SCRIPT_DIR = Path(__file__).resolve().parent
 FRIDA_HOOK = SCRIPT_DIR / "frida_hook.js"
+ADB_CACHE_FILE = SCRIPT_DIR / ".adb_path_cache"
 
 
+def _invalidate_adb_cache():
+    """Forget the cached ADB path (e.g. after it stopped existing)."""
+    find_adb.cache_clear()
+    try:
+        ADB_CACHE_FILE.unlink()
+    except OSError:
+        pass
+
+
+@functools.lru_cache(maxsize=1)
 def find_adb():
-    """Find ADB binary, checking common locations."""
+    """Find ADB binary, checking common locations. Result is cached."""
+    # Previously resolved path — one isfile check instead of the full probe
+    try:
+        cached = ADB_CACHE_FILE.read_text(encoding="utf-8").strip()
+        if cached and os.path.isfile(cached):
+            return cached
+    except OSError:
+        pass
+
     # Check PATH first
     adb = shutil.which("adb")
-    if adb:
-        return adb
 
-    # Common emulator ADB locations (Windows)
-    common_paths = [
-        r"C:\LDPlayer\LDPlayer9\adb.exe",
-        r"C:\LDPlayer\LDPlayer4\adb.exe",
-        r"C:\Program Files\Nox\bin\adb.exe",
-        r"C:\Program Files (x86)\Nox\bin\adb.exe",
-        os.path.expanduser(r"~\AppData\Local\Android\Sdk\platform-tools\adb.exe"),
-    ]
-
-    for p in common_paths:
-        if os.path.exists(p):
-            return p
+    if not adb:
+        # Common emulator ADB locations (Windows)
+        common_paths = [
+            r"C:\LDPlayer\LDPlayer9\adb.exe",
+            r"C:\LDPlayer\LDPlayer4\adb.exe",
+            r"C:\Program Files\Nox\bin\adb.exe",
+            r"C:\Program Files (x86)\Nox\bin\adb.exe",
+            os.path.expanduser(r"~\AppData\Local\Android\Sdk\platform-tools\adb.exe"),
+        ]
+        # One directory read per parent instead of one stat per candidate;
+        # a missing parent costs a single failed syscall for all of them.
+        by_parent = {}
+        for p in common_paths:
+            parent, name = os.path.split(p)
+            by_parent.setdefault(parent, []).append(name)
+        for parent, names in by_parent.items():
+            try:
+                entries = {e.name for e in os.scandir(parent)}
+            except OSError:
+                continue
+            for name in names:
+                if name in entries:
+                    adb = os.path.join(parent, name)
+                    break
+            if adb:
+                break
 
-    return None
+    if adb:
+        try:
+            ADB_CACHE_FILE.write_text(adb, encoding="utf-8")
+        except OSError:
+            pass
+    return adb
 
 
 def run_adb(adb, *args, serial=None, check=False):
@@ -65,10 +103,100 @@ def run_adb(adb, *args, serial=None, check=False):
     if serial:
         cmd += ["-s", serial]
     cmd.extend(args)
-    r = subprocess.run(cmd, capture_output=True, text=True)
+    # Raw pipes + explicit utf-8 decode: text=True goes through the locale
+    # codec, which is slow (and lossy) on Windows consoles.
+    try:
+        r = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    except FileNotFoundError:
+        # Cached ADB path went stale — forget it so the next run re-probes
+        _invalidate_adb_cache()
+        raise
     if check and r.returncode != 0:
-        raise RuntimeError(f"ADB command failed: {' '.join(args)}\n{r.stderr}")
-    return r.stdout.strip()
+        stderr = r.stderr.decode("utf-8", "replace")
+        raise RuntimeError(f"ADB command failed: {' '.join(args)}\n{stderr}")
+    return r.stdout.decode("utf-8", "replace").strip()
+
+
+class AdbSession:
+    """Persistent `adb shell` session for back-to-back commands.
+
+    Spawning adb once and feeding it commands over stdin amortizes the
+    process-start and transport-handshake cost that every one-shot
+    `adb shell ...` pays.
+    """
+
+    _SENTINEL = "__ADB_DONE__"
+
+    def __init__(self, adb, serial=None):
+        cmd = [adb]
+        if serial:
+            cmd += ["-s", serial]
+        cmd.append("shell")
+        self.proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+        )
+
+    def run(self, command):
+        """Run one shell command, return its output."""
+        self.proc.stdin.write(
+            f"{command}; echo {self._SENTINEL}\n".encode()
+        )
+        self.proc.stdin.flush()
+        lines = []
+        while True:
+            line = self.proc.stdout.readline()
+            if not line:
+                break
+            text = line.decode("utf-8", "replace").rstrip("\r\n")
+            if text.endswith(self._SENTINEL):
+                break
+            lines.append(text)
+        return "\n".join(lines).strip()
+
+    def close(self):
+        try:
+            self.proc.stdin.close()
+            self.proc.terminate()
+        except OSError:
+            pass
+
+
+# All device-readiness probes batched into one `adb shell` invocation.
+# Each `adb shell` costs a process spawn plus an ADB transport round-trip
+# (~50-150 ms on Windows), so one batched call beats seven individual ones.
+_CHECK_SCRIPT = (
+    "echo '===WHOAMI==='; whoami; "
+    "echo '===WVLIB==='; "
+    "ls -la /system/vendor/lib/libwvdrmengine.so "
+    "/vendor/lib/libwvdrmengine.so "
+    "/system/vendor/lib64/libwvdrmengine.so 2>/dev/null; "
+    "echo '===FRIDA==='; ls -la /data/local/tmp/frida-server* 2>/dev/null; "
+    "echo '===PS==='; ps | grep frida-server; "
+    "echo '===PROPS==='; "
+    "getprop ro.product.model; getprop ro.build.version.sdk"
+)
+
+
+def _split_sections(output):
+    """Split sentinel-marked shell output into {name: text}."""
+    sections = {}
+    current = None
+    lines = []
+    for line in output.split("\n"):
+        m = line.strip()
+        if m.startswith("===") and m.endswith("==="):
+            if current:
+                sections[current] = "\n".join(lines).strip()
+            current = m.strip("=")
+            lines = []
+        else:
+            lines.append(line)
+    if current:
+        sections[current] = "\n".join(lines).strip()
+    return sections
 
 
 def check_device(adb, serial=None):
@@ -76,46 +204,34 @@ def check_device(adb, serial=None):
     print("\n  Device Check")
     print(f"  {'─' * 40}")
 
-    # List devices
+    # List devices (host-side, separate from the on-device batch)
     devices = run_adb(adb, "devices")
     print(f"  ADB      : {adb}")
     print(f"  Devices  :\n{devices}")
 
+    # One batched shell call for all on-device probes
+    sections = _split_sections(run_adb(adb, "shell", _CHECK_SCRIPT, serial=serial))
+
     # Check root
-    root_out = run_adb(adb, "shell", "whoami", serial=serial)
+    root_out = sections.get("WHOAMI", "")
     print(f"  User     : {root_out}")
     if root_out != "root":
         print("  WARNING  : Device not rooted. Run: adb root")
 
     # Check Widevine library
-    lib_check = run_adb(
-        adb, "shell", "ls -la /system/vendor/lib/libwvdrmengine.so 2>/dev/null || "
-        "ls -la /vendor/lib/libwvdrmengine.so 2>/dev/null || "
-        "ls -la /system/vendor/lib64/libwvdrmengine.so 2>/dev/null || "
-        "echo 'NOT FOUND'",
-        serial=serial,
-    )
+    lib_check = sections.get("WVLIB") or "NOT FOUND"
     print(f"  WV Lib   : {lib_check}")
 
     # Check frida-server
-    frida_check = run_adb(
-        adb, "shell", "ls -la /data/local/tmp/frida-server* 2>/dev/null || echo 'NOT FOUND'",
-        serial=serial,
-    )
+    frida_check = sections.get("FRIDA") or "NOT FOUND"
     print(f"  Frida    : {frida_check.split(chr(10))[0]}")
 
     # Check if frida-server running
-    ps_check = run_adb(adb, "shell", "ps | grep frida-server || echo 'NOT RUNNING'", serial=serial)
-    running = "NOT RUNNING" not in ps_check
+    running = bool(sections.get("PS"))
     print(f"  Running  : {'Yes' if running else 'No'}")
 
     # Check DRM info
-    drm_info = run_adb(
-        adb, "shell",
-        "getprop ro.product.model; getprop ro.build.version.sdk",
-        serial=serial,
-    )
-    lines = drm_info.strip().split("\n")
+    lines = sections.get("PROPS", "").split("\n")
     if len(lines) >= 2:
         print(f"  Model    : {lines[0]}")
         print(f"  SDK      : {lines[1]}")
@@ -154,16 +270,19 @@ def start_frida(adb, serial=None):
 
     # Start in background
     run_adb(adb, "shell", f"su -c '{frida_path} -D &'", serial=serial)
-    time.sleep(2)
 
-    # Verify
-    ps = run_adb(adb, "shell", "ps | grep frida", serial=serial)
-    if "frida" in ps:
-        print(" OK")
-        return True
-    else:
-        print(" FAILED")
-        return False
+    # Poll instead of a flat 2 s sleep: fast devices come up in ~100 ms,
+    # slow ones still get the full window before we report failure.
+    # pgrep is a single exec with a direct exit, vs forking ps + grep.
+    for _ in range(20):
+        time.sleep(0.1)
+        ps = run_adb(adb, "shell", "pgrep -f frida-server", serial=serial)
+        if ps.strip():
+            print(" OK")
+            return True
+
+    print(" FAILED")
+    return False
 
 
 def run_extraction(serial=None):
@@ -208,16 +327,18 @@ def run_extraction(serial=None):
     except KeyboardInterrupt:
         print("\n\n  Extraction interrupted.")
 
-    # Check for extracted files
+    # Check for extracted files — one ls probes both paths at once
     print("\n  Checking for extracted files on device...")
-    key_check = run_adb(
-        adb, "shell",
-        "ls -la /data/local/tmp/private_key.pem 2>/dev/null || echo 'NOT FOUND'",
-        serial=serial,
+    shell = AdbSession(adb, serial)
+    found = shell.run(
+        "ls -la /data/local/tmp/private_key.pem "
+        "/data/local/tmp/client_id.bin 2>/dev/null"
     )
+    have_key = "private_key.pem" in found
+    have_client = "client_id.bin" in found
 
-    if "NOT FOUND" not in key_check:
-        print(f"  Found: {key_check}")
+    if have_key:
+        print(f"  Found: {found}")
         # Pull files
         key_local = SCRIPT_DIR / "private_key.pem"
         run_adb(adb, "pull", "/data/local/tmp/private_key.pem", str(key_local), serial=serial)
@@ -225,21 +346,25 @@ def run_extraction(serial=None):
 
         # Try to build .wvd if we have client_id too
         client_local = SCRIPT_DIR / "client_id.bin"
-        client_check = run_adb(
-            adb, "shell",
-            "ls /data/local/tmp/client_id.bin 2>/dev/null || echo 'NOT FOUND'",
-            serial=serial,
-        )
-        if "NOT FOUND" not in client_check:
+        if have_client:
             run_adb(adb, "pull", "/data/local/tmp/client_id.bin", str(client_local), serial=serial)
             print(f"  Pulled: {client_local}")
             print("\n  Building device.wvd...")
-            subprocess.run([
-                sys.executable, str(SCRIPT_DIR / "build_wvd.py"),
-                "--key", str(key_local),
-                "--client", str(client_local),
-                "--output", str(SCRIPT_DIR / "device.wvd"),
-            ])
+            # Call build_wvd in-process — spawning a fresh interpreter
+            # just re-pays startup plus the pywidevine import
+            try:
+                from build_wvd import build_wvd
+                build_wvd(
+                    str(key_local), str(client_local),
+                    str(SCRIPT_DIR / "device.wvd"),
+                )
+            except ImportError:
+                subprocess.run([
+                    sys.executable, str(SCRIPT_DIR / "build_wvd.py"),
+                    "--key", str(key_local),
+                    "--client", str(client_local),
+                    "--output", str(SCRIPT_DIR / "device.wvd"),
+                ])
         else:
             print("  Client ID not found. You may need to extract it manually.")
             print("  Use KeyDive instead: python run_keydive.py")
@@ -248,10 +373,10 @@ def run_extraction(serial=None):
         print("\n  Tip: The Frida hook needs a DRM video to be played.")
         print("  For automated extraction, use KeyDive: python run_keydive.py")
 
+    shell.close()
 
-def main():
-    import argparse
 
+def main():
     parser = argparse.ArgumentParser(
         description="CDM Extraction Orchestrator"
     )
@@ -4,8 +4,14 @@ Wrapper to run KeyDive with LDPlayer ADB in PATH.
 import os
 import sys
 
-# Add LDPlayer ADB to PATH before keydive checks for it
-os.environ['PATH'] += r';C:\LDPlayer\LDPlayer9'
+# Prepend LDPlayer ADB to PATH before keydive checks for it — first
+# entry means keydive's repeated which('adb') calls hit it immediately
+# instead of scanning the whole (possibly long) PATH every time.
+_LDPLAYER_DIR = r'C:\LDPlayer\LDPlayer9'
+_paths = os.environ['PATH'].split(os.pathsep)
+if _LDPLAYER_DIR not in _paths:
+    _paths.insert(0, _LDPLAYER_DIR)
+    os.environ['PATH'] = os.pathsep.join(_paths)
 
 # Now run keydive main
 sys.argv = [
@@ -27,23 +27,33 @@ Dependencies:
   Also requires: ffmpeg, yt-dlp (in PATH)
 """
 
+import atexit
 import os
 import sys
 import re
 import json
 import csv
 import time
+import math
 import random
 import base64
 import subprocess
 import shutil
 import tempfile
+import threading
 import argparse
-import urllib.request
+import functools
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from http.cookiejar import MozillaCookieJar
 from collections import Counter, defaultdict
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 try:
     from openpyxl import Workbook
     from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
@@ -62,7 +72,8 @@ if sys.platform == "win32":
 # ═══════════════════════════════════════════════════════════════════
 SCRIPT_DIR = Path(__file__).resolve().parent
 CDM_DIR = SCRIPT_DIR / "cdm"
-STATE_FILE = SCRIPT_DIR / ".download_state.json"
+STATE_FILE = SCRIPT_DIR / ".download_state.json"   # legacy, replayed once
+STATE_LOG = SCRIPT_DIR / ".download_state.jsonl"
 VERSION = "1.0v"
 
 LICENSE_URL_TPL = (
@@ -75,6 +86,51 @@ COURSE_URL_RE = (
     r"(?:course(?:/draft)*/)?(?P<slug>[a-zA-Z0-9_-]+))"
 )
 
+# Pre-compiled hot-path patterns — skips the re-cache lookup that
+# re.search/re.sub pay on every call (safe_name alone runs 300+ times
+# for a large course)
+_COURSE_URL_CRE = re.compile(COURSE_URL_RE)
+_SAFE_NAME_RE = re.compile(r'[<>:"/\\|?*\n\r]')
+_DEFAULT_KID_RE = re.compile(r'default_KID\s*=\s*"([^"]+)"', re.IGNORECASE)
+_PSSH_RE = re.compile(r"<(?:\w+:)?pssh[^>]*>([^<]+)</(?:\w+:)?pssh>")
+# Canonical cenc attribute key as ElementTree exposes it — spec-fixed
+# namespace, so a direct dict lookup covers conforming manifests
+_CENC_KID_ATTR = "{urn:mpeg:cenc:2013}default_KID"
+_DASH_TPL_RE = re.compile(r"\$(RepresentationID|Number|Time|Bandwidth)(%0\d+d)?\$")
+_ISO_DUR_RE = re.compile(r"PT(?:(\d+)H)?(?:(\d+)M)?(?:([\d.]+)S)?")
+
+# Widevine system ID (fixed across all content)
+_WV_SYSTEM_ID = bytes.fromhex("edef8ba979d64acea3c827dcd51d21ed")
+# A v0 single-KID Widevine PSSH box is fixed apart from the KID itself:
+# size 52, "pssh" fourcc, zero version/flags, system id, 20-byte data
+# length, then the 4-byte protobuf framing the 16-byte KID follows
+_PSSH_TEMPLATE = (
+    (52).to_bytes(4, "big") + b"pssh" + bytes(4)
+    + _WV_SYSTEM_ID + (20).to_bytes(4, "big") + b"\x08\x01\x12\x10"
+)
+
+# Resolve external tools once — shutil.which walks (and stats) every
+# PATH entry, and the failure paths re-ran it per lecture. Absolute
+# paths in argv also spare the exec PATH search.
+_FFMPEG = shutil.which("ffmpeg") or "ffmpeg"
+_YTDLP = shutil.which("yt-dlp") or "yt-dlp"
+_PACKAGER = shutil.which("packager")
+
+# VTT -> SRT conversion patterns (hot: run per line over every subtitle)
+_CUE_SETTINGS_RE = re.compile(r"\s+(position|align|line|size|vertical):.*")
+_TAG_RE = re.compile(r"<[^>]+>")
+
+# Saved-article shell — only the title and body vary per lecture
+_ARTICLE_HEAD = (
+    "<!DOCTYPE html><html><head>"
+    "<meta charset='utf-8'>"
+    "<title>{title}</title>"
+    "<style>body{{font-family:sans-serif;max-width:800px;"
+    "margin:40px auto;padding:0 20px;line-height:1.6}}</style>"
+    "</head><body><h1>{title}</h1>"
+)
+_ARTICLE_TAIL = "</body></html>"
+
 CURRICULUM_PARAMS = {
     "fields[lecture]": (
         "title,object_index,asset,supplementary_assets,description"
@@ -105,21 +161,112 @@ DELAY_BETWEEN_LECTURES = (1.0, 3.0)  # Between processing lectures
 MAX_COURSES_PER_DAY = 3       # Max courses to download in 24 hours
 MAX_LECTURES_PER_SESSION = 150  # Max lectures per session (safety net)
 
+# How long a prefetched media license token is trusted (server-side
+# expiry is ~3-5 min; stay well inside it)
+LICENSE_TOKEN_TTL = 180
+
+# Disk-cache lifetimes: curriculum rarely changes mid-download; MPD
+# bodies only need to survive key retries within one token window;
+# the enrolled-course list moves slowest of all
+CURRICULUM_CACHE_TTL = 6 * 3600
+MPD_CACHE_TTL = 300
+COURSES_CACHE_TTL = 3600
+
+# Streaming copy buffer. 64 KiB reads cap throughput on fast links
+# through sheer syscall count; 1 MiB keeps the pipe full and small
+# bodies still finish in a single read
+STREAM_CHUNK = 1 << 20
+
+# Hard ceiling for one decrypt/mux run. The merges are stream copies,
+# so even multi-GB lectures finish in minutes; anything longer is a
+# wedged ffmpeg that would otherwise stall the mux pool forever
+DECRYPT_TIMEOUT = 30 * 60
+
+# Range-request slice for single-file MP4 downloads. Big enough that
+# request overhead vanishes, small enough that a failed slice only
+# re-fetches a few seconds of video on resume
+RANGE_CHUNK = 8 << 20
+
 
 # ═══════════════════════════════════════════════════════════════════
 # Helpers
 # ═══════════════════════════════════════════════════════════════════
+# Memoized: the same lecture title is sanitized again by each of the
+# video/article/caption/supplement paths, so repeat calls dominate
+@functools.lru_cache(maxsize=4096)
 def safe_name(s):
     """Strip invalid filename characters."""
-    return re.sub(r'[<>:"/\\|?*\n\r]', "_", s).strip().rstrip(".")
+    return _SAFE_NAME_RE.sub("_", s).strip().rstrip(".")
+
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+
+def _run_tool(cmd, stderr=subprocess.DEVNULL, timeout=None):
+    """Run an external tool with quiet pipes.
+
+    Centralizes the spawn defaults: stdout always goes to DEVNULL and
+    stderr does too unless a caller needs the error tail. With no
+    capture pipes inherited, modern CPython closes descriptors via
+    close_range() on exec instead of walking the whole fd table.
+    On timeout the child is killed and TimeoutExpired propagates.
+    """
+    return subprocess.run(
+        cmd, stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL, stderr=stderr,
+        text=stderr == subprocess.PIPE,
+        timeout=timeout,
+    )
+
+
+def _atomic_write(path, data):
+    """Write bytes via a .part temp + os.replace.
+
+    An interrupted direct write leaves a partial file that resume runs
+    treat as done; the rename makes the final path all-or-nothing.
+    """
+    part = path.with_suffix(path.suffix + ".part")
+    with open(part, "wb") as f:
+        f.write(data)
+    os.replace(part, path)
+
+
+def _file_size(path):
+    """Size in bytes, or -1 when missing — one stat, not exists()+stat()."""
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return -1
+
+
+def _fast_course_slug(u):
+    """Resolve (portal, slug) from a clean course URL without the regex.
+
+    Covers the common https://<portal>.udemy.com/course/<slug>/ shape in
+    a couple of substring scans; anything else returns None and goes
+    through COURSE_URL_RE as before.
+    """
+    host_idx = u.find(".udemy.com/")
+    if host_idx < 0:
+        return None
+    _, sep, rest = u.rpartition("/course/")
+    if not sep or rest.startswith("draft/"):
+        return None  # draft URLs keep their regex handling
+    slug = rest.split("/", 1)[0].split("?", 1)[0]
+    portal = u[:host_idx].rpartition("/")[2]
+    if not slug or not portal or not slug.replace("-", "").replace("_", "").isalnum():
+        return None
+    return portal, slug
 
 
 def fmt_size(n):
-    for u in ("B", "KB", "MB", "GB"):
-        if n < 1024:
-            return f"{n:.1f} {u}"
-        n /= 1024
-    return f"{n:.1f} TB"
+    # Unit index straight from the bit length — one division instead of
+    # a repeated-divide loop
+    n = int(n)
+    if n <= 0:
+        return "0.0 B"
+    idx = min((n.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{n / (1 << (idx * 10)):.1f} {_SIZE_UNITS[idx]}"
 
 
 def _parse_duration_to_minutes(dur_str):
@@ -144,15 +291,38 @@ def _format_minutes(total_mins):
 
 def parse_chapters(s):
     """Parse '1,3-5,7' into {1, 3, 4, 5, 7}."""
-    result = set()
-    for part in s.split(","):
-        part = part.strip()
+    def span(part):
         if "-" in part:
             a, b = part.split("-", 1)
-            result.update(range(int(a), int(b) + 1))
-        else:
-            result.add(int(part))
-    return result
+            return range(int(a), int(b) + 1)
+        return (int(part),)
+
+    return {n for part in s.split(",") for n in span(part.strip())}
+
+
+class _ProgressPrinter:
+    """Throttled single-line progress output.
+
+    print(..., end="\r") flushes stdio on every call, and the discovery
+    loops can emit hundreds of updates per second. Updates are dropped
+    unless the flush interval has elapsed; done() always writes.
+    """
+
+    def __init__(self, interval=0.1):
+        self.interval = interval
+        self._last = 0.0
+
+    def update(self, msg):
+        now = time.monotonic()
+        if now - self._last >= self.interval:
+            sys.stdout.write("\r" + msg)
+            sys.stdout.flush()
+            self._last = now
+
+    def done(self, msg):
+        sys.stdout.write("\r" + msg + "\n")
+        sys.stdout.flush()
+        self._last = 0.0
 
 
 def safe_delay(delay_range):
@@ -160,6 +330,33 @@ def safe_delay(delay_range):
     time.sleep(random.uniform(*delay_range))
 
 
+class _RateGate:
+    """Elapsed-aware pacing between operations.
+
+    safe_delay always sleeps the full interval even when the work since
+    the previous call already took longer than that — across hundreds
+    of lectures the unconditional sleeps add up to minutes of dead
+    time. The gate draws the same random interval but credits time
+    already spent, so it only blocks when operations complete faster
+    than the rate it enforces. Holding the lock through the sleep
+    serializes concurrent workers, keeping the aggregate rate identical
+    whether one or several threads pass through.
+    """
+
+    def __init__(self, delay_range):
+        self.delay_range = delay_range
+        self._lock = threading.Lock()
+        self._next_at = 0.0
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            if now < self._next_at:
+                time.sleep(self._next_at - now)
+                now = time.monotonic()
+            self._next_at = now + random.uniform(*self.delay_range)
+
+
 def wait_for_network(timeout=600, check_interval=5):
     """Block until internet is available. Returns True if restored, False if timed out."""
     import socket
@@ -181,23 +378,147 @@ def wait_for_network(timeout=600, check_interval=5):
     return False
 
 
+def _json_loads(data):
+    """orjson when available (3-5x faster parse), stdlib otherwise."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    if isinstance(data, bytes):
+        data = data.decode("utf-8")
+    return json.loads(data)
+
+
+def _json_dump_bytes(obj, indent=False):
+    """Serialize to UTF-8 bytes, via orjson when available."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
+
+
+_openai_local = threading.local()
+
+# Categorization runs at temperature 0, so an identical payload gets
+# an identical answer — responses persist keyed by payload hash and
+# re-runs over the same titles cost no API calls
+_OPENAI_CACHE = SCRIPT_DIR / ".cache" / "openai_cache.json"
+_openai_cache = None
+_openai_cache_lock = threading.Lock()
+
+
+def _openai_cache_get(key):
+    global _openai_cache
+    with _openai_cache_lock:
+        if _openai_cache is None:
+            try:
+                _openai_cache = _json_loads(_OPENAI_CACHE.read_bytes())
+            except (OSError, ValueError):
+                _openai_cache = {}
+        return _openai_cache.get(key)
+
+
+def _openai_cache_put(key, body):
+    with _openai_cache_lock:
+        _openai_cache[key] = body
+        try:
+            _OPENAI_CACHE.parent.mkdir(parents=True, exist_ok=True)
+            _atomic_write(_OPENAI_CACHE, _json_dump_bytes(_openai_cache))
+        except OSError:
+            pass
+
+
+def _openai_post(payload, api_key, timeout=90):
+    """POST a chat-completions payload over a kept-alive connection.
+
+    urllib.request opens a fresh TLS connection per call; across
+    dozens of categorization batches the handshakes add up. Each
+    thread keeps one http.client connection and reuses it, with a
+    single reconnect retry for keep-alives the server closed.
+    Returns the response body bytes; raises on HTTP errors.
+    """
+    import hashlib
+    import http.client
+
+    cache_key = hashlib.sha256(payload).hexdigest()
+    cached = _openai_cache_get(cache_key)
+    if cached is not None:
+        return cached.encode()
+
+    headers = {
+        "Content-Type": "application/json",
+        "Authorization": f"Bearer {api_key}",
+        "Connection": "keep-alive",
+    }
+    for attempt in range(2):
+        conn = getattr(_openai_local, "conn", None)
+        if conn is None:
+            conn = http.client.HTTPSConnection("api.openai.com",
+                                               timeout=timeout)
+            _openai_local.conn = conn
+        try:
+            conn.request("POST", "/v1/chat/completions", body=payload,
+                         headers=headers)
+            resp = conn.getresponse()
+            body = resp.read()
+        except (OSError, http.client.HTTPException):
+            # Stale keep-alive — drop the connection and retry once
+            conn.close()
+            _openai_local.conn = None
+            if attempt:
+                raise
+            continue
+        if resp.status != 200:
+            raise RuntimeError(f"HTTP {resp.status}: {body[:200].decode(errors='replace')}")
+        _openai_cache_put(cache_key, body.decode("utf-8", "replace"))
+        return body
+
+
 def load_state():
-    """Load daily download state from disk."""
-    if STATE_FILE.exists():
+    """Rebuild today's download state by replaying the append log.
+
+    Recording an event is an O(1) append (see record_course_download)
+    instead of a full-file JSON rewrite; the replay here filters to
+    today's entries and compacts the log whenever older days linger.
+    """
+    today = time.strftime("%Y-%m-%d")
+    courses = []
+    stale = False
+    try:
+        with open(STATE_LOG, "rb") as f:
+            for line in f:
+                try:
+                    entry = _json_loads(line)
+                except ValueError:
+                    continue  # torn write from a killed run
+                if entry.get("date") == today:
+                    cid = str(entry.get("course"))
+                    if cid not in courses:
+                        courses.append(cid)
+                else:
+                    stale = True
+    except OSError:
+        # One-time migration from the old whole-file JSON state
         try:
-            data = json.loads(STATE_FILE.read_text(encoding="utf-8"))
-            # Reset if date changed
-            if data.get("date") != time.strftime("%Y-%m-%d"):
-                return {"date": time.strftime("%Y-%m-%d"), "courses": []}
-            return data
-        except (json.JSONDecodeError, KeyError):
+            data = _json_loads(STATE_FILE.read_bytes())
+            if data.get("date") == today:
+                courses = [str(c) for c in data.get("courses", [])]
+                # Seed the log now, or the first append would shadow
+                # the migrated entries on the next load
+                _compact_state_log(today, courses)
+        except (OSError, ValueError, KeyError):
             pass
-    return {"date": time.strftime("%Y-%m-%d"), "courses": []}
+    if stale:
+        _compact_state_log(today, courses)
+    return {"date": today, "courses": courses}
 
 
-def save_state(state):
-    """Save daily download state to disk."""
-    STATE_FILE.write_text(json.dumps(state, indent=2), encoding="utf-8")
+def _compact_state_log(today, courses):
+    """Rewrite the log with only today's entries so it never grows."""
+    try:
+        _atomic_write(STATE_LOG, b"".join(
+            _json_dump_bytes({"date": today, "course": c}) + b"\n"
+            for c in courses
+        ))
+    except OSError:
+        pass
 
 
 def check_daily_limit(course_id):
@@ -221,12 +542,14 @@ def check_daily_limit(course_id):
 
 
 def record_course_download(course_id):
-    """Record that a course was downloaded today."""
+    """Record that a course was downloaded today (one appended line)."""
     state = load_state()
     cid = str(course_id)
-    if cid not in state.get("courses", []):
-        state.setdefault("courses", []).append(cid)
-        save_state(state)
+    if cid in state["courses"]:
+        return
+    with open(STATE_LOG, "ab") as f:
+        f.write(_json_dump_bytes({"date": state["date"], "course": cid})
+                + b"\n")
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -234,39 +557,84 @@ def record_course_download(course_id):
 # ═══════════════════════════════════════════════════════════════════
 class UdemySession:
     def __init__(self, cookie_path):
+        # Pin libcurl to one CA bundle up front so it isn't re-located
+        # and re-parsed per request (no-op when certifi is absent)
+        try:
+            import certifi
+            os.environ.setdefault("CURL_CA_BUNDLE", certifi.where())
+        except ImportError:
+            pass
+
         # Load Netscape cookies
         jar = MozillaCookieJar(cookie_path)
         jar.load(ignore_discard=True, ignore_expires=True)
 
-        # Create curl_cffi session with Chrome impersonation
+        # Create curl_cffi session with Chrome impersonation.
+        # Keep-alive plus a roomy connection pool lets the hundreds of
+        # API/MPD/license calls per course reuse warm TLS connections
+        # instead of re-handshaking whenever the default pool fills up.
         try:
             from curl_cffi import requests as creq
-            self.s = creq.Session(impersonate="chrome120")
+            try:
+                from curl_cffi.const import CurlOpt
+                self.s = creq.Session(
+                    impersonate="chrome120",
+                    default_headers=True,
+                    curl_options={
+                        CurlOpt.TCP_KEEPALIVE: 1,
+                        CurlOpt.TCP_KEEPIDLE: 60,
+                        CurlOpt.MAXCONNECTS: 32,
+                        CurlOpt.FORBID_REUSE: 0,
+                        # CURL_HTTP_VERSION_2TLS: multiplex api-2.0
+                        # calls over one connection. Chrome
+                        # impersonation negotiates h2 anyway; pinning
+                        # it keeps that independent of library defaults
+                        CurlOpt.HTTP_VERSION: 4,
+                    },
+                )
+            except (ImportError, TypeError):
+                # Older curl_cffi without curl_options — defaults still
+                # keep connections alive, just with a smaller pool
+                self.s = creq.Session(impersonate="chrome120")
         except ImportError:
             print("ERROR: curl_cffi required. Install: pip install curl_cffi")
             sys.exit(1)
 
-        # Inject cookies
-        self.bearer = None
-        for c in jar:
-            self.s.cookies.set(c.name, c.value, domain=c.domain)
-            if c.name == "access_token":
-                self.bearer = c.value.strip('"')
-
-        # Auth headers
-        if self.bearer:
-            self.s.headers["Authorization"] = f"Bearer {self.bearer}"
-            self.s.headers["X-Udemy-Authorization"] = f"Bearer {self.bearer}"
+        # Inject cookies in one update instead of per-cookie set() calls
+        # (each set() re-normalizes the whole jar). The session only ever
+        # talks to udemy.com, so other domains are dropped here too.
+        cookies_dict = {
+            c.name: c.value for c in jar if c.domain.endswith("udemy.com")
+        }
+        self.s.cookies.update(cookies_dict)
+        self.bearer = cookies_dict.get("access_token", "").strip('"') or None
 
-        self.s.headers.update({
+        # Auth + default headers in a single update
+        headers = {
             "Origin": "https://www.udemy.com",
             "Referer": "https://www.udemy.com/",
             "Accept": "application/json, text/plain, */*",
-        })
+            "Connection": "keep-alive",
+        }
+        if self.bearer:
+            headers["Authorization"] = f"Bearer {self.bearer}"
+            headers["X-Udemy-Authorization"] = f"Bearer {self.bearer}"
+        self.s.headers.update(headers)
+
+    # Transient statuses worth an automatic retry (urllib3 Retry's
+    # status_forcelist equivalent — curl_cffi has no adapter hook)
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
 
     def get(self, url, params=None, **kw):
         kw.setdefault("timeout", 30)
-        r = self.s.get(url, params=params, **kw)
+        # Short asset fetches (captions, supplements, articles) are
+        # latency-bound; a single 503 or 429 shouldn't fail them.
+        # Exponential backoff: 0.3 s, 0.6 s.
+        for attempt in range(3):
+            r = self.s.get(url, params=params, **kw)
+            if r.status_code not in self.RETRY_STATUSES or attempt == 2:
+                break
+            time.sleep(0.3 * (2 ** attempt))
         self._check_cf(r)
         return r
 
@@ -277,9 +645,18 @@ class UdemySession:
     def get_json(self, url, params=None):
         r = self.get(url, params=params)
         r.raise_for_status()
-        return r.json()
+        # Decode through _json_loads: multi-MB curriculum and course
+        # pages parse 2-3x faster under orjson when it's installed
+        return _json_loads(r.content)
 
     def _check_cf(self, r):
+        # Challenge pages are served as HTML. Skip the scan for other
+        # content types — it can never match on MP4/segment bytes, and
+        # r.text on a binary body forces a full errors="replace" str
+        # decode on the media hot path
+        ctype = getattr(r, "headers", {}).get("content-type", "")
+        if "html" not in ctype.lower():
+            return
         if hasattr(r, "text") and (
             "Just a moment" in r.text
             or "challenge-platform" in r.text
@@ -296,34 +673,113 @@ class UdemySession:
 class WidevineDRM:
     def __init__(self):
         self.device = None
+        self.cdm = None
         wvd = CDM_DIR / "device.wvd"
         if wvd.exists():
             try:
                 from pywidevine.device import Device
+                from pywidevine.cdm import Cdm
                 self.device = Device.load(str(wvd))
+                # Build the Cdm once — from_device re-derives RSA
+                # constants, so rebuilding it per lecture is pure waste
+                self.cdm = Cdm.from_device(self.device)
             except Exception as e:
                 print(f"  Warning: Could not load CDM: {e}")
+        # kid (hex) -> key (hex). KIDs repeat across lectures of a
+        # course constantly, so a hit skips the MPD's license roundtrip
+        self._key_cache = {}
+        self._key_cache_file = None
+        self._key_cache_lock = threading.Lock()
 
     @property
     def available(self):
-        return self.device is not None
+        return self.cdm is not None
+
+    def load_key_cache(self, course_id):
+        """Point the KID→key cache at the per-course JSON sidecar."""
+        self._key_cache_file = CDM_DIR / f"keys_{course_id}.json"
+        try:
+            cached = _json_loads(self._key_cache_file.read_bytes())
+            if isinstance(cached, dict):
+                self._key_cache = cached
+        except (OSError, ValueError):
+            pass
 
-    def get_keys(self, session, mpd_url, license_token):
-        """Fetch MPD, extract PSSH, get Widevine license, return keys."""
+    def _save_key_cache(self):
+        if self._key_cache_file is None:
+            return
+        try:
+            _atomic_write(self._key_cache_file,
+                          _json_dump_bytes(self._key_cache, indent=True))
+        except OSError:
+            pass
+
+    def get_keys(self, session, mpd_url, license_token, mpd_cache=None):
+        """Fetch MPD, extract PSSH, get Widevine license.
+
+        Returns deduplicated [(kid, key)] pairs as raw bytes.
+        """
         if not self.available:
             return []
 
-        from pywidevine.cdm import Cdm
         from pywidevine.pssh import PSSH
 
-        # 1. Fetch MPD and extract PSSH/KIDs
-        r = session.get(mpd_url)
-        if r.status_code != 200:
-            print(f"    MPD fetch failed: {r.status_code}")
-            return []
-        mpd_text = r.text
+        # 1. Fetch MPD and extract PSSH/KIDs (identity encoding: the MPD
+        # is consumed once, so decompression buys nothing here).
+        # A fresh per-lecture disk cache lets key retries within the
+        # token window skip the refetch entirely.
+        mpd_file = None
+        if mpd_cache is not None:
+            try:
+                if time.time() - mpd_cache.stat().st_mtime < MPD_CACHE_TTL:
+                    mpd_file = open(mpd_cache, "rb")
+            except OSError:
+                pass
 
-        psshs, kids = self._parse_mpd_drm(mpd_text)
+        if mpd_file is None:
+            # Stream into a spooled file so the body feeds iterparse
+            # without first materializing a full Python string.
+            headers = {"Accept-Encoding": "identity"}
+            try:
+                r = session.get(mpd_url, headers=headers, stream=True)
+            except TypeError:
+                # Older curl_cffi without stream support
+                r = session.get(mpd_url, headers=headers)
+            if r.status_code != 200:
+                print(f"    MPD fetch failed: {r.status_code}")
+                return []
+
+            mpd_file = tempfile.SpooledTemporaryFile(max_size=1 << 20)
+            try:
+                for chunk in r.iter_content(chunk_size=STREAM_CHUNK):
+                    mpd_file.write(chunk)
+            except (AttributeError, TypeError):
+                mpd_file.write(r.content)
+            finally:
+                if hasattr(r, "close"):
+                    r.close()
+            mpd_file.seek(0)
+
+            if mpd_cache is not None:
+                # os.replace so readers never see a partial manifest
+                try:
+                    mpd_cache.parent.mkdir(parents=True, exist_ok=True)
+                    tmp = mpd_cache.with_suffix(".tmp")
+                    with open(tmp, "wb") as out:
+                        shutil.copyfileobj(mpd_file, out, STREAM_CHUNK)
+                    os.replace(tmp, mpd_cache)
+                except OSError:
+                    pass
+                mpd_file.seek(0)
+
+        psshs, kids = self._parse_mpd_drm(mpd_file)
+
+        # Cache hit: every KID in the manifest already has a key from an
+        # earlier lecture — skip the license exchange entirely
+        with self._key_cache_lock:
+            if kids and all(k in self._key_cache for k in kids):
+                return [(bytes.fromhex(k), bytes.fromhex(self._key_cache[k]))
+                        for k in kids]
 
         # Construct PSSH from KID if needed
         if not psshs and kids:
@@ -332,8 +788,8 @@ class WidevineDRM:
             print("    No PSSH found in MPD")
             return []
 
-        # 2. CDM license exchange
-        cdm = Cdm.from_device(self.device)
+        # 2. CDM license exchange (sessions are cheap; the Cdm is not)
+        cdm = self.cdm
         sid = cdm.open()
         try:
             pssh = PSSH(psshs[0])
@@ -357,87 +813,239 @@ class WidevineDRM:
                 return []
 
             cdm.parse_license(sid, resp.content)
+            # Keep keys as raw bytes — the decrypt callers hex-encode
+            # exactly once where a tool needs text. Dedupe while
+            # preserving order (licenses can repeat a key).
             keys = []
+            seen = set()
             for k in cdm.get_keys(sid):
-                if str(k.type) == "CONTENT":
-                    kid_hex = k.kid.hex if isinstance(k.kid.hex, str) else k.kid.hex()
-                    key_hex = k.key.hex if isinstance(k.key.hex, str) else k.key.hex()
-                    keys.append((kid_hex, key_hex))
+                if str(k.type) != "CONTENT":
+                    continue
+                kid = k.kid.bytes if hasattr(k.kid, "bytes") else bytes(k.kid)
+                pair = (kid, bytes(k.key))
+                if pair not in seen:
+                    seen.add(pair)
+                    keys.append(pair)
+            if keys:
+                with self._key_cache_lock:
+                    for kid, key in keys:
+                        self._key_cache[kid.hex()] = key.hex()
+                    self._save_key_cache()
             return keys
         finally:
             cdm.close(sid)
 
-    def _parse_mpd_drm(self, mpd_text):
-        """Extract PSSH boxes and KIDs from MPD XML."""
+    def _parse_mpd_drm(self, mpd):
+        """Extract PSSH boxes and KIDs from MPD XML.
+
+        Accepts the manifest as a str or a binary file-like (the fetch
+        streams into a spooled file). One iterparse pass at C speed
+        instead of two regex scans over the full manifest; falls back to
+        the regex scan if the manifest isn't well-formed XML.
+        """
+        import io
+        from xml.etree.ElementTree import iterparse, ParseError
+
+        if isinstance(mpd, str):
+            source = io.StringIO(mpd)
+        else:
+            mpd.seek(0)
+            source = mpd
+
         psshs, kids = [], []
-        for m in re.finditer(
-            r'default_KID\s*=\s*"([^"]+)"', mpd_text, re.IGNORECASE
-        ):
+        pssh_seen, kid_seen = set(), set()
+        try:
+            for _, elem in iterparse(source, events=("end",)):
+                tag = elem.tag.rpartition("}")[2]
+                if tag == "pssh":
+                    val = (elem.text or "").strip()
+                    if val and val not in pssh_seen:
+                        pssh_seen.add(val)
+                        psshs.append(val)
+                elif elem.attrib:
+                    val = elem.attrib.get(_CENC_KID_ATTR)
+                    if val is None:
+                        # Non-standard namespace — fall back to a scan
+                        for attr, v in elem.attrib.items():
+                            if attr.rpartition("}")[2] == "default_KID":
+                                val = v
+                                break
+                    if val is not None:
+                        kid = val.replace("-", "").lower().strip()
+                        if len(kid) == 32 and kid not in kid_seen:
+                            kid_seen.add(kid)
+                            kids.append(kid)
+                elem.clear()
+        except ParseError:
+            if isinstance(mpd, str):
+                text = mpd
+            else:
+                mpd.seek(0)
+                text = mpd.read().decode("utf-8", "replace")
+            return self._parse_mpd_drm_regex(text)
+        return psshs, kids
+
+    def _parse_mpd_drm_regex(self, mpd_text):
+        """Regex fallback for manifests the XML parser rejects."""
+        psshs, kids = [], []
+        for m in _DEFAULT_KID_RE.finditer(mpd_text):
             kid = m.group(1).replace("-", "").lower().strip()
             if kid and len(kid) == 32 and kid not in kids:
                 kids.append(kid)
-        for m in re.finditer(
-            r"<(?:\w+:)?pssh[^>]*>([^<]+)</(?:\w+:)?pssh>", mpd_text
-        ):
+        for m in _PSSH_RE.finditer(mpd_text):
             val = m.group(1).strip()
             if val and val not in psshs:
                 psshs.append(val)
         return psshs, kids
 
     def _build_pssh(self, kid_hex):
-        """Construct a Widevine PSSH box from a KID."""
-        kid_bytes = bytes.fromhex(kid_hex)
-        pssh_data = b"\x08\x01\x12\x10" + kid_bytes
-        wv_sysid = bytes.fromhex("edef8ba979d64acea3c827dcd51d21ed")
-        box_size = 32 + len(pssh_data)
-        pssh_box = (
-            box_size.to_bytes(4, "big")
-            + b"pssh"
-            + b"\x00\x00\x00\x00"
-            + wv_sysid
-            + len(pssh_data).to_bytes(4, "big")
-            + pssh_data
-        )
-        return base64.b64encode(pssh_box).decode()
+        """Construct a Widevine PSSH box from a KID.
+
+        Everything except the KID is constant for a v0 single-KID box,
+        so the 36-byte header lives in _PSSH_TEMPLATE and each call
+        only appends the KID.
+        """
+        return base64.b64encode(
+            _PSSH_TEMPLATE + bytes.fromhex(kid_hex)
+        ).decode()
 
 
 # ═══════════════════════════════════════════════════════════════════
 # Course Downloader
 # ═══════════════════════════════════════════════════════════════════
 class UdemyDownloader:
-    def __init__(self, session, output_dir="downloads", quality=1080):
+    def __init__(self, session, output_dir="downloads", quality=1080, jobs=1,
+                 fragments=4):
         self.session = session
         self.output_dir = Path(output_dir)
         self.quality = quality
+        self.jobs = max(1, jobs)
+        # yt-dlp fragment parallelism — a single stream's segments all
+        # come from the same CDN host, so this is bandwidth, not API,
+        # pressure
+        self.fragments = max(1, fragments)
         self.portal = "www"
-        self.drm = WidevineDRM()
+        # Built lazily — pywidevine's import plus the device.wvd load
+        # cost real startup time, and --list/--categorize never decrypt
+        self._drm = None
         self.course_id = None
-        self.stats = {"downloaded": 0, "skipped": 0, "failed": 0}
+        # Enrolled-course list, memoized for the life of the run
+        self._all_courses = None
+        # (path, mtime, size) -> parsed course-CSV caches
+        self._csv_caches = {}
+        self.stats = Counter(downloaded=0, skipped=0, failed=0)
+        self._stats_lock = threading.Lock()
+        self._lecture_gate = _RateGate(DELAY_BETWEEN_LECTURES)
+        # lecture_id -> (license_token, mpd_url, fetched_at) from the
+        # per-chapter prefetch
+        self._fresh_tokens = {}
+        # When the curriculum payload was issued — its embedded tokens
+        # are only trustworthy inside the license TTL from this moment
+        self._curriculum_fetched_at = 0.0
+        # One temp root for the whole run: per-lecture mkdtemp/rmtree
+        # churned directory syscalls for every DRM lecture
+        self._tmp_root = Path(tempfile.mkdtemp(prefix="udl_root_"))
+        atexit.register(shutil.rmtree, self._tmp_root, ignore_errors=True)
+        # Pool that runs decrypt/mux steps off the critical path: the
+        # next lecture's network fetch overlaps the CPU/disk-bound
+        # ffmpeg passes. Sized so several capped ffmpeg instances
+        # (-threads 4 each) share the cores instead of one process
+        # stalling on I/O with the rest of the box idle. Purely local
+        # work, so this doesn't touch the network-side rate limits.
+        self._mux_workers = max(1, (os.cpu_count() or 4) // 4)
+        self._mux_pool = ThreadPoolExecutor(max_workers=self._mux_workers)
+        # Pool for captions/supplements — tiny latency-bound GETs that
+        # shouldn't block the lecture loop. Futures collect per chapter.
+        self._asset_pool = ThreadPoolExecutor(max_workers=8)
+        self._asset_futures = []
+        self._asset_lock = threading.Lock()
+        # Lecture ids whose article body came back empty — cached per
+        # course so re-runs don't repeat the pointless fetch
+        self._empty_articles = set()
+
+    @property
+    def drm(self):
+        """The Widevine CDM wrapper, loaded on first DRM use."""
+        if self._drm is None:
+            self._drm = WidevineDRM()
+        return self._drm
+
+    def _bump(self, key):
+        """Thread-safe stats increment (lectures may download in parallel)."""
+        with self._stats_lock:
+            self.stats[key] += 1
 
     # ── Course Discovery ──────────────────────────────────────────
 
+    def _fetch_pages(self, url, params, n_pages):
+        """Yield pages 2..n_pages concurrently, in page order.
+
+        Page 1's `count` makes the remaining page numbers knowable
+        up-front, so they go through a small thread pool instead of a
+        strictly sequential loop. A shared throttle spreads the usual
+        DELAY_API pacing across the pool so the aggregate request rate
+        stays the same as before — only the latency overlaps. Pages
+        stream out as they land, so callers process page N while later
+        pages are still in flight.
+        """
+        throttle = threading.Lock()
+
+        def fetch(page):
+            p = dict(params)
+            p["page"] = str(page)
+            with throttle:
+                time.sleep(random.uniform(*DELAY_API))
+            return self.session.get_json(url, p)
+
+        workers = min(4, max(1, n_pages - 1))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            yield from pool.map(fetch, range(2, n_pages + 1))
+
     def _fetch_all_courses(self):
-        """Fetch ALL enrolled courses with pagination."""
+        """Fetch ALL enrolled courses with pagination.
+
+        Memoized on the instance — a --list followed by a download in
+        the same run re-paginates nothing — and mirrored to a 1-hour
+        disk cache so back-to-back CLI runs skip the fetch too.
+        """
+        if self._all_courses is not None:
+            return self._all_courses
+
+        cache_file = SCRIPT_DIR / ".cache" / "courses.json"
+        try:
+            if time.time() - cache_file.stat().st_mtime < COURSES_CACHE_TTL:
+                courses = _json_loads(cache_file.read_bytes())
+                if isinstance(courses, list) and courses:
+                    print(f"  Found {len(courses)} enrolled courses (cached)")
+                    self._all_courses = courses
+                    return courses
+        except (OSError, ValueError):
+            pass
+
         url = f"https://{self.portal}.udemy.com/api-2.0/users/me/subscribed-courses"
-        all_courses = []
-        page = 1
+        params = dict(MY_COURSES_PARAMS)
+        data = self.session.get_json(url, params)
+        all_courses = list(data.get("results", []))
 
-        while True:
-            params = dict(MY_COURSES_PARAMS)
-            params["page"] = str(page)
-            data = self.session.get_json(url, params)
-            results = data.get("results", [])
-            all_courses.extend(results)
+        total = data.get("count", len(all_courses))
+        progress = _ProgressPrinter()
+        progress.update(f"  Fetching courses... {len(all_courses)}/{total}")
 
-            total = data.get("count", len(all_courses))
-            print(f"  Fetching courses... {len(all_courses)}/{total}", end="\r")
+        page_size = int(MY_COURSES_PARAMS["page_size"])
+        n_pages = math.ceil(total / page_size) if total else 1
+        if n_pages > 1:
+            for page_data in self._fetch_pages(url, params, n_pages):
+                all_courses.extend(page_data.get("results", []))
+                progress.update(f"  Fetching courses... {len(all_courses)}/{total}")
 
-            if not data.get("next"):
-                break
-            page += 1
-            safe_delay(DELAY_API)
+        progress.done(f"  Found {len(all_courses)} enrolled courses" + " " * 20)
 
-        print(f"  Found {len(all_courses)} enrolled courses" + " " * 20)
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            _atomic_write(cache_file, _json_dump_bytes(all_courses))
+        except OSError:
+            pass
+        self._all_courses = all_courses
         return all_courses
 
     def _check_course_drm(self, course_id):
@@ -472,63 +1080,71 @@ class UdemyDownloader:
                     continue
                 return "N/A"
 
-    def _load_drm_cache(self, csv_path):
-        """Load previous DRM results from CSV, return {url: 'DRM'|'No DRM'}."""
-        cache = {}
+    def _load_csv_caches(self, csv_path):
+        """Parse a saved course CSV once; return (drm_cache, cat_cache).
+
+        drm_cache is {url: 'DRM'|'No DRM'|'N/A'} and cat_cache is
+        {url: (category, subcategory)}. The result is memoized per
+        (path, mtime, size) so --dif_drm and --cat in the same run
+        share one pass instead of each re-reading the file.
+        """
         try:
-            with open(csv_path, "r", encoding="utf-8-sig") as f:
-                reader = csv.reader(f)
-                headers = next(reader, None)
-                if not headers:
-                    return cache
-                drm_idx = url_idx = None
-                for i, h in enumerate(headers):
-                    if "DRM" in h.upper():
-                        drm_idx = i
-                    if "URL" in h.upper():
-                        url_idx = i
-                if drm_idx is None or url_idx is None:
-                    return cache
-                for row in reader:
-                    if len(row) > max(drm_idx, url_idx):
-                        url = row[url_idx].strip()
-                        drm_val = row[drm_idx].strip()
-                        if url and drm_val in ("DRM", "No DRM", "N/A"):
-                            cache[url] = drm_val
-        except (FileNotFoundError, StopIteration):
-            pass
-        return cache
+            st = os.stat(csv_path)
+            memo_key = (str(csv_path), st.st_mtime_ns, st.st_size)
+        except OSError:
+            return {}, {}
+        cached = self._csv_caches.get(memo_key)
+        if cached is not None:
+            return cached
 
-    def _load_category_cache(self, csv_path):
-        """Load previous category results from CSV, return {url: (cat, subcat)}."""
-        cache = {}
+        drm_cache, cat_cache = {}, {}
         try:
-            with open(csv_path, "r", encoding="utf-8-sig") as f:
+            with open(csv_path, "r", encoding="utf-8-sig", newline="") as f:
                 reader = csv.reader(f)
-                headers = next(reader, None)
-                if not headers:
-                    return cache
-                url_idx = cat_idx = sub_idx = None
+                headers = next(reader, None) or []
+                url_idx = drm_idx = cat_idx = sub_idx = None
                 for i, h in enumerate(headers):
                     hl = h.strip().upper()
-                    if hl == "URL":
+                    if "URL" in hl:
                         url_idx = i
+                    elif "DRM" in hl:
+                        drm_idx = i
                     elif hl == "CATEGORY":
                         cat_idx = i
                     elif hl == "SUBCATEGORY":
                         sub_idx = i
-                if url_idx is None or cat_idx is None or sub_idx is None:
-                    return cache
-                for row in reader:
-                    if len(row) > max(url_idx, cat_idx, sub_idx):
+                want_drm = url_idx is not None and drm_idx is not None
+                want_cat = (url_idx is not None and cat_idx is not None
+                            and sub_idx is not None)
+                if want_drm or want_cat:
+                    for row in reader:
+                        n = len(row)
+                        if url_idx >= n:
+                            continue
                         url = row[url_idx].strip()
-                        cat = row[cat_idx].strip()
-                        sub = row[sub_idx].strip()
-                        if url and cat:
-                            cache[url] = (cat, sub)
+                        if not url:
+                            continue
+                        if want_drm and drm_idx < n:
+                            drm_val = row[drm_idx].strip()
+                            if drm_val in ("DRM", "No DRM", "N/A"):
+                                drm_cache[url] = drm_val
+                        if want_cat and cat_idx < n and sub_idx < n:
+                            cat = row[cat_idx].strip()
+                            if cat:
+                                cat_cache[url] = (cat, row[sub_idx].strip())
         except (FileNotFoundError, StopIteration):
             pass
-        return cache
+
+        self._csv_caches[memo_key] = (drm_cache, cat_cache)
+        return drm_cache, cat_cache
+
+    def _load_drm_cache(self, csv_path):
+        """Load previous DRM results from CSV, return {url: 'DRM'|'No DRM'}."""
+        return self._load_csv_caches(csv_path)[0]
+
+    def _load_category_cache(self, csv_path):
+        """Load previous category results from CSV, return {url: (cat, subcat)}."""
+        return self._load_csv_caches(csv_path)[1]
 
     def _call_openai(self, titles_batch, api_key):
         """Send a batch of course titles to OpenAI for categorization."""
@@ -554,17 +1170,8 @@ class UdemyDownloader:
             "temperature": 0,
         }).encode()
 
-        req = urllib.request.Request(
-            "https://api.openai.com/v1/chat/completions",
-            data=payload,
-            headers={
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {api_key}",
-            },
-        )
         try:
-            with urllib.request.urlopen(req, timeout=90) as resp:
-                data = json.loads(resp.read())
+            data = json.loads(_openai_post(payload, api_key))
             content = data["choices"][0]["message"]["content"]
             # Strip markdown fences if present
             content = content.strip()
@@ -608,23 +1215,32 @@ class UdemyDownloader:
 
         print(f"  Categorizing {len(to_categorize)} courses via OpenAI...")
 
-        # Process in batches of 30
+        # Process in batches of 30 — batches are independent requests,
+        # so run a few in flight at once. The shared throttle keeps the
+        # aggregate request rate near what the old fixed sleep allowed,
+        # just without serializing the (up to 90 s) response waits.
         batch_size = 30
-        for start in range(0, len(to_categorize), batch_size):
-            batch = to_categorize[start:start + batch_size]
-            titles = [r["title"] for r in batch]
-            done = min(start + batch_size, len(to_categorize))
-            print(f"  Categorizing: {done}/{len(to_categorize)}...", end="\r", flush=True)
-
-            result = self._call_openai(titles, api_key)
-            for j, row in enumerate(batch):
-                cat, sub = result.get(j, ("Other", ""))
-                row["category"] = cat
-                row["subcategory"] = sub
-
-            time.sleep(0.5)
-
-        print(f"  Categorization complete for {len(to_categorize)} courses" + " " * 20)
+        batches = [to_categorize[i:i + batch_size]
+                   for i in range(0, len(to_categorize), batch_size)]
+        throttle = threading.Lock()
+
+        def categorize(batch):
+            with throttle:
+                time.sleep(0.5)
+            return batch, self._call_openai([r["title"] for r in batch], api_key)
+
+        done = 0
+        progress = _ProgressPrinter()
+        with ThreadPoolExecutor(max_workers=min(3, len(batches))) as pool:
+            for batch, result in pool.map(categorize, batches):
+                for j, row in enumerate(batch):
+                    cat, sub = result.get(j, ("Other", ""))
+                    row["category"] = cat
+                    row["subcategory"] = sub
+                done += len(batch)
+                progress.update(f"  Categorizing: {done}/{len(to_categorize)}...")
+
+        progress.done(f"  Categorization complete for {len(to_categorize)} courses" + " " * 20)
         return csv_rows
 
     def list_courses(self, save_path=None, show_dur=False, show_drm=False, show_cat=False, api_key=None):
@@ -663,14 +1279,29 @@ class UdemyDownloader:
             else:
                 print(f"\n  Checking DRM status for {len(courses)} courses...")
 
-            for i, c in enumerate(to_check, 1):
-                cid = c.get("id")
-                print(f"  Checking DRM: {i}/{len(to_check)}...", end="\r", flush=True)
-                drm_status[cid] = self._check_course_drm(cid)
-                safe_delay(DELAY_API)
-
+            # The list endpoints expose no reliable per-course DRM field,
+            # so the curriculum probe stays — but every probe is an
+            # independent request, so overlap them in a small pool. The
+            # shared throttle spreads DELAY_API pacing across workers so
+            # the burst profile stays close to the sequential loop's.
             if to_check:
-                print(f"  DRM check complete" + " " * 30)
+                throttle = threading.Lock()
+
+                def probe(c):
+                    with throttle:
+                        time.sleep(random.uniform(*DELAY_API))
+                    cid = c.get("id")
+                    return cid, self._check_course_drm(cid)
+
+                done = 0
+                progress = _ProgressPrinter()
+                workers = min(6, len(to_check))
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    for cid, status in pool.map(probe, to_check):
+                        drm_status[cid] = status
+                        done += 1
+                        progress.update(f"  Checking DRM: {done}/{len(to_check)}...")
+                progress.done(f"  DRM check complete" + " " * 30)
 
         print(f"\n{'='*60}")
         print(f"  Enrolled Courses ({len(courses)})")
@@ -756,16 +1387,15 @@ class UdemyDownloader:
                     if show_cat:
                         headers.extend(["Category", "Subcategory"])
                     writer.writerow(headers)
-                    for row in csv_rows:
-                        r = [row["num"], row["title"], row["url"]]
-                        if show_dur:
-                            r.append(row["duration"])
-                        if show_drm:
-                            r.append(row["drm"])
-                        if show_cat:
-                            r.append(row.get("category", ""))
-                            r.append(row.get("subcategory", ""))
-                        writer.writerow(r)
+                    # One writerows call keeps the row-format loop in C
+                    writer.writerows(
+                        [row["num"], row["title"], row["url"]]
+                        + ([row["duration"]] if show_dur else [])
+                        + ([row["drm"]] if show_drm else [])
+                        + ([row.get("category", ""),
+                            row.get("subcategory", "")] if show_cat else [])
+                        for row in csv_rows
+                    )
                     # Summary row
                     writer.writerow([])
                     if show_dur:
@@ -791,12 +1421,33 @@ class UdemyDownloader:
 
     def find_course(self, url_or_slug):
         """Resolve a course URL/slug to course info dict."""
-        m = re.search(COURSE_URL_RE, url_or_slug)
-        if m:
-            self.portal = m.group("portal")
-            slug = m.group("slug")
+        fast = _fast_course_slug(url_or_slug)
+        if fast:
+            self.portal, slug = fast
         else:
-            slug = url_or_slug.strip("/").split("/")[-1]
+            m = _COURSE_URL_CRE.search(url_or_slug)
+            if m:
+                self.portal = m.group("portal")
+                slug = m.group("slug")
+            else:
+                slug = url_or_slug.strip("/").split("/")[-1]
+
+        # Targeted lookup first: the search endpoint resolves a slug in
+        # one request instead of paginating through the whole library.
+        try:
+            params = dict(MY_COURSES_PARAMS)
+            params["search"] = slug.replace("-", " ")
+            params["page_size"] = "10"
+            data = self.session.get_json(
+                f"https://{self.portal}.udemy.com/api-2.0/users/me/"
+                f"subscribed-courses/",
+                params,
+            )
+            for c in data.get("results", []):
+                if c.get("published_title") == slug or str(c.get("id")) == slug:
+                    return c
+        except Exception:
+            pass  # search can 400 on odd slugs; the full scan still works
 
         courses = self._fetch_all_courses()
 
@@ -812,24 +1463,50 @@ class UdemyDownloader:
     # ── Curriculum ────────────────────────────────────────────────
 
     def get_curriculum(self, course_id):
-        """Fetch complete curriculum with pagination."""
+        """Fetch complete curriculum with pagination.
+
+        A recent on-disk copy is reused so resumed runs don't re-walk
+        the whole (paginated) curriculum just to skip existing files.
+        """
+        cache_file = SCRIPT_DIR / ".cache" / str(course_id) / "curriculum.json"
+        try:
+            mtime = cache_file.stat().st_mtime
+            if time.time() - mtime < CURRICULUM_CACHE_TTL:
+                results = _json_loads(cache_file.read_bytes())
+                print(f"  Loaded {len(results)} curriculum items (cached)")
+                self._curriculum_fetched_at = mtime
+                return results
+        except (OSError, ValueError):
+            pass
+
         url = (
             f"https://{self.portal}.udemy.com/api-2.0/courses/"
             f"{course_id}/subscriber-curriculum-items/"
         )
-        results = []
         params = dict(CURRICULUM_PARAMS)
+        data = self.session.get_json(url, params)
+        results = list(data.get("results", []))
+        progress = _ProgressPrinter()
+        progress.update(f"  Fetched {len(results)} items...")
+
+        total = data.get("count", len(results))
+        page_size = int(CURRICULUM_PARAMS["page_size"])
+        n_pages = math.ceil(total / page_size) if total else 1
+        if n_pages > 1:
+            for page_data in self._fetch_pages(url, params, n_pages):
+                results.extend(page_data.get("results", []))
+                progress.update(f"  Fetched {len(results)} items...")
+
+        progress.done(f"  Fetched {len(results)} curriculum items" + " " * 10)
+        self._curriculum_fetched_at = time.time()
 
-        while url:
-            data = self.session.get_json(url, params)
-            results.extend(data.get("results", []))
-            url = data.get("next")
-            params = None  # next URL includes params
-            print(f"  Fetched {len(results)} items...", end="\r")
-            if url:
-                safe_delay(DELAY_API)
-
-        print(f"  Fetched {len(results)} curriculum items" + " " * 10)
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp = cache_file.with_suffix(".tmp")
+            tmp.write_bytes(_json_dump_bytes(results))
+            os.replace(tmp, cache_file)
+        except OSError:
+            pass
         return results
 
     # ── Main Download ─────────────────────────────────────────────
@@ -842,8 +1519,15 @@ class UdemyDownloader:
         course = self.find_course(course_url)
         course_id = course["id"]
         self.course_id = course_id
+        self.drm.load_key_cache(course_id)
         course_title = safe_name(course.get("title", str(course_id)))
 
+        empty_articles_file = SCRIPT_DIR / ".cache" / str(course_id) / "empty_articles.json"
+        try:
+            self._empty_articles = set(_json_loads(empty_articles_file.read_bytes()))
+        except (OSError, ValueError):
+            self._empty_articles = set()
+
         # Daily safety limit
         if not force and not check_daily_limit(course_id):
             return
@@ -869,17 +1553,22 @@ class UdemyDownloader:
         course_dir = self.output_dir / course_title
         course_dir.mkdir(parents=True, exist_ok=True)
 
-        # Process items
+        # Process items — lectures are collected per chapter and flushed
+        # as a batch, so they can overlap when --jobs > 1
         chapter_dir = course_dir
         chapter_idx = 0
         lecture_num = 0
         lectures_processed = 0
         active_chapter = True
+        batch = []
 
         for item in items:
             cls = item.get("_class")
 
             if cls == "chapter":
+                self._process_chapter_batch(batch)
+                batch = []
+
                 chapter_idx += 1
                 active_chapter = (
                     chapters_filter is None or chapter_idx in chapters_filter
@@ -908,8 +1597,22 @@ class UdemyDownloader:
                           f"processed. Use --force to continue.")
                     break
 
-                self._process_lecture(item, chapter_dir, lecture_num)
-                safe_delay(DELAY_BETWEEN_LECTURES)
+                batch.append((item, chapter_dir, lecture_num))
+
+        self._process_chapter_batch(batch)
+
+        # Drain pending decrypt/mux work before reporting
+        self._mux_pool.shutdown(wait=True)
+        self._mux_pool = ThreadPoolExecutor(max_workers=self._mux_workers)
+
+        if self._empty_articles:
+            try:
+                empty_articles_file.parent.mkdir(parents=True, exist_ok=True)
+                tmp = empty_articles_file.with_suffix(".tmp")
+                tmp.write_bytes(_json_dump_bytes(sorted(self._empty_articles)))
+                os.replace(tmp, empty_articles_file)
+            except OSError:
+                pass
 
         # Summary
         elapsed = time.time() - start_time
@@ -926,7 +1629,124 @@ class UdemyDownloader:
 
     # ── Lecture Processing ────────────────────────────────────────
 
-    def _process_lecture(self, lecture, chapter_dir, num):
+    def _process_chapter_batch(self, batch):
+        """Process one chapter's lectures — sequential, or in a bounded pool.
+
+        Chapter boundaries stay synchronous: the whole batch finishes
+        before the next chapter starts, so directory ordering and console
+        output stay grouped by chapter.
+        """
+        if not batch:
+            return
+
+        # One scandir snapshot per chapter replaces the exists()+stat()
+        # pair every lecture would otherwise pay for skip detection —
+        # noticeable on networked filesystems.
+        existing = self._scan_existing(batch[0][1])
+        self._prefetch_tokens(batch, existing)
+
+        if self.jobs <= 1:
+            for lecture, chapter_dir, num in batch:
+                self._lecture_gate.wait()
+                self._process_lecture(lecture, chapter_dir, num, existing)
+        else:
+            with ThreadPoolExecutor(max_workers=self.jobs) as pool:
+                futures = [
+                    pool.submit(self._process_lecture_gated,
+                                lecture, chapter_dir, num, existing)
+                    for lecture, chapter_dir, num in batch
+                ]
+                for future in as_completed(futures):
+                    future.result()
+
+        self._drain_assets()
+
+    def _drain_assets(self):
+        """Wait out the caption/supplement fetches queued by a chapter."""
+        with self._asset_lock:
+            futures, self._asset_futures = self._asset_futures, []
+        for future in futures:
+            future.result()
+
+    @staticmethod
+    def _scan_existing(chapter_dir):
+        """Snapshot a chapter directory as {filename: size} in one pass."""
+        try:
+            with os.scandir(chapter_dir) as entries:
+                return {e.name: e.stat(follow_symlinks=False).st_size
+                        for e in entries}
+        except OSError:
+            return {}
+
+    def _prefetch_tokens(self, batch, existing=None):
+        """Fetch license tokens for a chapter's DRM lectures in parallel.
+
+        Each DRM lecture otherwise pays a separate sequential API round
+        trip inside _dl_drm. Prefetching per chapter (not per course)
+        keeps every token comfortably inside its ~3-5 min validity.
+        """
+        if not self.course_id:
+            return
+
+        lecture_ids = []
+        for lecture, chapter_dir, num in batch:
+            asset = lecture.get("asset") or {}
+            if asset.get("asset_type") != "Video":
+                continue
+            stream_urls = asset.get("stream_urls") or {}
+            if stream_urls.get("Video") or not asset.get("media_sources"):
+                continue  # non-DRM or no sources
+            title = safe_name(lecture.get("title", "Untitled"))
+            name = f"{num:03d} {title}.mp4"
+            size = existing.get(name, 0) if existing is not None \
+                else _file_size(chapter_dir / name)
+            if size > 1000:
+                continue  # will be skipped anyway
+            if lecture.get("id"):
+                lecture_ids.append(lecture["id"])
+
+        if not lecture_ids:
+            return
+
+        def fetch(lid):
+            try:
+                url = (
+                    f"https://{self.portal}.udemy.com/api-2.0/users/me/"
+                    f"subscribed-courses/{self.course_id}/lectures/{lid}/"
+                )
+                r = self.session.get(url, params={
+                    "fields[lecture]": "asset",
+                    "fields[asset]": "media_license_token,media_sources",
+                }, timeout=15)
+                if r.status_code == 200:
+                    fresh = r.json().get("asset", {})
+                    token = fresh.get("media_license_token")
+                    mpd = None
+                    for src in fresh.get("media_sources", []):
+                        if src.get("type") == "application/dash+xml":
+                            mpd = src.get("src")
+                            break
+                    if token:
+                        return lid, (token, mpd, time.time())
+            except Exception:
+                pass
+            return lid, None
+
+        with ThreadPoolExecutor(max_workers=min(4, len(lecture_ids))) as pool:
+            for lid, entry in pool.map(fetch, lecture_ids):
+                if entry:
+                    self._fresh_tokens[lid] = entry
+
+    def _process_lecture_gated(self, lecture, chapter_dir, num, existing=None):
+        """Stagger lecture starts through one gate.
+
+        Keeps the request rate human-like without serializing the
+        downloads themselves — workers overlap once past the gate.
+        """
+        self._lecture_gate.wait()
+        self._process_lecture(lecture, chapter_dir, num, existing)
+
+    def _process_lecture(self, lecture, chapter_dir, num, existing=None):
         """Process a single lecture (video, article, etc)."""
         title = lecture.get("title", "Untitled")
         lecture_id = lecture.get("id")
@@ -939,7 +1759,8 @@ class UdemyDownloader:
         asset_type = asset.get("asset_type", "")
 
         if asset_type == "Video":
-            self._download_video(asset, chapter_dir, num, title, lecture_id)
+            self._download_video(asset, chapter_dir, num, title, lecture_id,
+                                 existing)
         elif asset_type == "Article":
             self._download_article(asset, chapter_dir, num, title, lecture_id)
         elif asset_type == "E-Book":
@@ -949,24 +1770,30 @@ class UdemyDownloader:
         else:
             print(f"  [{num:03d}] {title} - {asset_type} (skipped)")
 
-        # Captions/subtitles
-        for cap in asset.get("captions", []):
-            self._download_caption(cap, chapter_dir, num, title)
-
-        # Supplementary assets
-        for sup in lecture.get("supplementary_assets", []):
-            self._download_supplement(sup, chapter_dir, num)
+        # Captions and supplements are small independent GETs — queue
+        # them on the asset pool; the chapter batch waits for them all
+        with self._asset_lock:
+            for cap in asset.get("captions", []):
+                self._asset_futures.append(self._asset_pool.submit(
+                    self._download_caption, cap, chapter_dir, num, title))
+            for sup in lecture.get("supplementary_assets", []):
+                self._asset_futures.append(self._asset_pool.submit(
+                    self._download_supplement, sup, chapter_dir, num))
 
     # ── Video Download ────────────────────────────────────────────
 
-    def _download_video(self, asset, chapter_dir, num, title, lecture_id=None):
+    def _download_video(self, asset, chapter_dir, num, title, lecture_id=None,
+                        existing=None):
         safe_title = safe_name(title)
         output = chapter_dir / f"{num:03d} {safe_title}.mp4"
 
-        if output.exists() and output.stat().st_size > 1000:
-            sz = output.stat().st_size / 1024 / 1024
-            print(f"  [{num:03d}] {title} - EXISTS ({sz:.1f} MB)")
-            self.stats["skipped"] += 1
+        if existing is not None:
+            size = existing.get(output.name, 0)
+        else:
+            size = _file_size(output)
+        if size > 1000:
+            print(f"  [{num:03d}] {title} - EXISTS ({size / 1024 / 1024:.1f} MB)")
+            self._bump("skipped")
             return
 
         stream_urls = asset.get("stream_urls")
@@ -975,51 +1802,371 @@ class UdemyDownloader:
         if stream_urls and stream_urls.get("Video"):
             self._dl_non_drm(stream_urls, output, num, title)
         elif media_sources:
-            self._dl_drm(media_sources, output, num, title, lecture_id)
+            self._dl_drm(media_sources, output, num, title, lecture_id,
+                         curriculum_token=asset.get("media_license_token"))
         else:
             print(f"  [{num:03d}] {title} - No video sources available")
-            self.stats["failed"] += 1
+            self._bump("failed")
+
+
+    # ── In-process DASH download ──────────────────────────────────
+
+    @staticmethod
+    def _tpl_fill(template, rep_id, bandwidth, number=None, time_val=None):
+        """Expand a SegmentTemplate URL ($RepresentationID$, $Number%05d$...)."""
+        values = {
+            "RepresentationID": rep_id,
+            "Bandwidth": bandwidth,
+            "Number": number,
+            "Time": time_val,
+        }
+
+        def sub(m):
+            val = values[m.group(1)]
+            if val is None:
+                raise ValueError(f"${m.group(1)}$ not available")
+            return (m.group(2) % val) if m.group(2) else str(val)
+
+        return _DASH_TPL_RE.sub(sub, template)
+
+    def _dash_streams(self, mpd_bytes, mpd_url):
+        """Parse an MPD into [(kind, init_url, [segment_urls])].
+
+        Covers the SegmentTemplate layouts Udemy serves (SegmentTimeline
+        or fixed duration). Returns None for anything else so the caller
+        can fall back to yt-dlp, which understands everything.
+        """
+        import urllib.parse
+        from xml.etree import ElementTree as ET
+
+        def local(el):
+            return el.tag.rpartition("}")[2]
+
+        def children(el, name):
+            return [c for c in el if local(c) == name]
+
+        def first(el, name):
+            return next(iter(children(el, name)), None)
+
+        try:
+            root = ET.fromstring(mpd_bytes)
+            base = mpd_url
+            for b in children(root, "BaseURL"):
+                base = urllib.parse.urljoin(base, (b.text or "").strip())
+
+            streams = []
+            for period in children(root, "Period"):
+                pbase = base
+                for b in children(period, "BaseURL"):
+                    pbase = urllib.parse.urljoin(pbase, (b.text or "").strip())
+                for aset in children(period, "AdaptationSet"):
+                    reps = children(aset, "Representation")
+                    if not reps:
+                        continue
+                    kind = None
+                    for probe in (aset.get("contentType"), aset.get("mimeType"),
+                                  reps[0].get("mimeType")):
+                        if probe and probe.startswith("video"):
+                            kind = "video"
+                            break
+                        if probe and probe.startswith("audio"):
+                            kind = "audio"
+                            break
+                    if kind is None:
+                        continue
+                    if any(k == kind for k, _, _ in streams):
+                        return None  # multi-period: let yt-dlp handle it
+
+                    def bw(r):
+                        return int(r.get("bandwidth") or 0)
+
+                    if kind == "video":
+                        fitting = [r for r in reps
+                                   if int(r.get("height") or 0) <= self.quality]
+                        rep = max(fitting, key=bw) if fitting else min(reps, key=bw)
+                    else:
+                        rep = max(reps, key=bw)
+
+                    tpl = first(rep, "SegmentTemplate") or first(aset, "SegmentTemplate")
+                    if tpl is None:
+                        return None
+                    media, init = tpl.get("media"), tpl.get("initialization")
+                    if not media or not init:
+                        return None
+
+                    rep_id = rep.get("id", "")
+                    bandwidth = int(rep.get("bandwidth") or 0)
+                    start = int(tpl.get("startNumber") or 1)
+                    timeline = first(tpl, "SegmentTimeline")
+                    segs = []
+                    if timeline is not None:
+                        t, n = 0, start
+                        for seg in children(timeline, "S"):
+                            if seg.get("t") is not None:
+                                t = int(seg.get("t"))
+                            d = int(seg.get("d"))
+                            repeat = int(seg.get("r") or 0)
+                            if repeat < 0:
+                                return None  # open-ended repeat (live)
+                            for _ in range(repeat + 1):
+                                segs.append(self._tpl_fill(
+                                    media, rep_id, bandwidth, number=n, time_val=t))
+                                t += d
+                                n += 1
+                    else:
+                        duration = tpl.get("duration")
+                        total = self._iso_duration(
+                            root.get("mediaPresentationDuration")
+                            or period.get("duration"))
+                        if not duration or total is None:
+                            return None
+                        timescale = int(tpl.get("timescale") or 1)
+                        count = math.ceil(total * timescale / int(duration))
+                        segs = [self._tpl_fill(media, rep_id, bandwidth, number=i)
+                                for i in range(start, start + count)]
+
+                    init_url = urllib.parse.urljoin(
+                        pbase, self._tpl_fill(init, rep_id, bandwidth))
+                    segs = [urllib.parse.urljoin(pbase, u) for u in segs]
+                    streams.append((kind, init_url, segs))
+        except (ET.ParseError, ValueError, TypeError):
+            return None
+
+        if not any(k == "video" for k, _, _ in streams):
+            return None
+        return streams
+
+    @staticmethod
+    def _iso_duration(value):
+        """Parse an ISO-8601 duration (PT1H2M3.5S) into seconds, or None."""
+        if not value:
+            return None
+        m = _ISO_DUR_RE.match(value)
+        if not m or not any(m.groups()):
+            return None
+        h, mn, sec = m.groups()
+        return int(h or 0) * 3600 + int(mn or 0) * 60 + float(sec or 0)
+
+    def _dash_fetch(self, init_url, seg_urls, dest):
+        """Fetch init + segments concurrently, concatenate in order."""
+        urls = [init_url] + seg_urls
+
+        def grab(idx_url):
+            idx, u = idx_url
+            part = f"{dest}.part{idx:05d}"
+            r = self.session.get(u, timeout=60)
+            if r.status_code != 200:
+                raise RuntimeError(f"segment HTTP {r.status_code}")
+            with open(part, "wb") as f:
+                f.write(r.content)
+            return part
+
+        parts = []
+        try:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                parts = list(pool.map(grab, enumerate(urls)))
+            with open(dest, "wb") as out:
+                for part in parts:
+                    with open(part, "rb") as f:
+                        shutil.copyfileobj(f, out, STREAM_CHUNK)
+            return True
+        except Exception:
+            return False
+        finally:
+            # `parts` is still [] when pool.map raises, so sweep by
+            # pattern — a stray .partNNNNN left behind would satisfy
+            # the caller's video*/audio* prefix scan on the next pass
+            dest_path = Path(dest)
+            for part in dest_path.parent.glob(dest_path.name + ".part*"):
+                try:
+                    part.unlink()
+                except OSError:
+                    pass
+
+    def _dash_download(self, mpd_url, tmpdir, mpd_cache=None):
+        """Download DASH streams in-process over the existing session.
+
+        yt-dlp spawns a fresh process per stream and can't reuse the
+        Session's Cloudflare-bypassing TLS fingerprint or its warm
+        keepalive connections. Returns True when video.mp4 (and audio.m4a
+        if present) landed in tmpdir; False sends the caller to yt-dlp.
+        """
+        mpd_bytes = None
+        if mpd_cache is not None:
+            try:
+                if time.time() - mpd_cache.stat().st_mtime < MPD_CACHE_TTL:
+                    mpd_bytes = mpd_cache.read_bytes()
+            except OSError:
+                pass
+        if mpd_bytes is None:
+            try:
+                r = self.session.get(
+                    mpd_url, headers={"Accept-Encoding": "identity"}, timeout=30)
+                if r.status_code != 200:
+                    return False
+                mpd_bytes = r.content
+            except Exception:
+                return False
+
+        streams = self._dash_streams(mpd_bytes, mpd_url)
+        if not streams:
+            return False
+
+        names = {"video": "video.mp4", "audio": "audio.m4a"}
+        # Streams arrive in MPD document order and audio-first manifests
+        # are legal — fetch video first so a failed video hands the
+        # whole attempt to yt-dlp before any audio work, and a failed
+        # audio after a landed video stays tolerable (video-only mux)
+        for kind, init_url, seg_urls in sorted(
+                streams, key=lambda s: s[0] != "video"):
+            dest = os.path.join(tmpdir, names[kind])
+            if not self._dash_fetch(init_url, seg_urls, dest):
+                return kind == "audio"
+        return True
+
+    def _ranged_download(self, url, output):
+        """Chunked Range download of a single MP4 with on-disk resume.
+
+        Fetches RANGE_CHUNK slices concurrently over the session (warm
+        Cloudflare-passing connections) and pwrites them into a
+        preallocated .part file. Completed slice indices persist in a
+        sidecar .meta, so a rerun fetches only what's missing instead
+        of restarting from byte 0. Returns False when the server
+        ignores Range requests or a slice keeps failing — the caller
+        falls back to yt-dlp.
+        """
+        try:
+            probe = self.session.get(
+                url, headers={"Range": "bytes=0-0"}, timeout=30)
+            if probe.status_code != 206:
+                return False
+            # CloudFront happily ranges .m3u8 playlist text too — never
+            # commit anything but actual video bytes to the output name
+            ctype = probe.headers.get("content-type", "").lower()
+            if "mpegurl" in ctype or ctype.startswith("text/"):
+                return False
+            total = int(
+                probe.headers.get("content-range", "").rpartition("/")[2])
+        except Exception:
+            return False
+        if total <= 0:
+            return False
+
+        part = output.with_name(output.name + ".part")
+        meta_path = output.with_name(output.name + ".meta")
+        n_chunks = math.ceil(total / RANGE_CHUNK)
+
+        # Trust the sidecar only if it was written for this exact size —
+        # a re-signed CDN URL can point at a different encode
+        done = set()
+        try:
+            meta = _json_loads(meta_path.read_bytes())
+            if meta.get("size") == total and part.stat().st_size == total:
+                done = set(meta.get("done", []))
+        except Exception:
+            pass
+
+        lock = threading.Lock()
+        fd = os.open(part, os.O_RDWR | os.O_CREAT
+                     | getattr(os, "O_BINARY", 0), 0o644)
+        try:
+            os.ftruncate(fd, total)
+
+            def grab(idx):
+                lo = idx * RANGE_CHUNK
+                hi = min(lo + RANGE_CHUNK, total) - 1
+                r = self.session.get(
+                    url, headers={"Range": f"bytes={lo}-{hi}"}, timeout=120)
+                if r.status_code != 206 or len(r.content) != hi - lo + 1:
+                    raise RuntimeError(f"range HTTP {r.status_code}")
+                if hasattr(os, "pwrite"):
+                    # pwrite is positioned: workers share one fd safely
+                    os.pwrite(fd, r.content, lo)
+                else:
+                    # Windows has no pwrite — seek+write must be one
+                    # atomic pair under the meta lock
+                    with lock:
+                        os.lseek(fd, lo, os.SEEK_SET)
+                        os.write(fd, r.content)
+                with lock:
+                    done.add(idx)
+                    _atomic_write(meta_path, _json_dump_bytes(
+                        {"size": total, "done": sorted(done)}))
+
+            todo = [i for i in range(n_chunks) if i not in done]
+            with ThreadPoolExecutor(
+                    max_workers=min(self.fragments, 8)) as pool:
+                list(pool.map(grab, todo))
+        except Exception:
+            return False  # .part and .meta stay for the next attempt
+        finally:
+            os.close(fd)
+
+        try:
+            meta_path.unlink()
+        except OSError:
+            pass
+        os.replace(part, output)
+        return True
 
     def _dl_non_drm(self, stream_urls, output, num, title):
         """Download non-DRM video using best available source."""
         sources = stream_urls.get("Video", [])
         if not sources:
             print(f"  [{num:03d}] {title} - No sources")
-            self.stats["failed"] += 1
+            self._bump("failed")
             return
 
-        # Find best quality <= preference
-        best = sources[0]
-        for s in sources:
+        # Find best quality <= preference in one C-level max() pass
+        def _quality_key(s):
             try:
                 label = int(s.get("label", 0))
-                if label <= self.quality:
-                    if int(best.get("label", 0)) < label:
-                        best = s
             except (ValueError, TypeError):
-                continue
+                return -1
+            return label if label <= self.quality else -1
+
+        best = max(sources, key=_quality_key)
 
         url = best.get("file") or best.get("src")
         quality_label = best.get("label", "?")
 
         if not url:
             print(f"  [{num:03d}] {title} - No download URL")
-            self.stats["failed"] += 1
+            self._bump("failed")
             return
 
         print(f"  [{num:03d}] {title} ({quality_label}p)...", end="", flush=True)
 
-        for _dl_attempt in range(3):
-            cmd = [
-                "yt-dlp", "--no-warnings", "--no-check-certificates",
-                "-o", str(output), url,
-            ]
-            r = subprocess.run(cmd, capture_output=True, text=True)
+        # Only a single-file MP4 source can be range-assembled; HLS-only
+        # courses select an "Auto" application/x-mpegURL entry here and
+        # that playlist must go to yt-dlp, not into an .mp4 on disk
+        is_mp4 = (best.get("type") == "video/mp4"
+                  or url.partition("?")[0].lower().endswith(".mp4"))
 
-            if output.exists() and output.stat().st_size > 1000:
-                sz = output.stat().st_size / 1024 / 1024
-                print(f" {sz:.1f} MB")
-                self.stats["downloaded"] += 1
+        for _dl_attempt in range(3):
+            # Direct MP4s: ranged in-process download first (resumable,
+            # reuses the session's connections); yt-dlp covers HLS,
+            # servers that ignore Range, and any slice that keeps failing
+            if not (is_mp4 and self._ranged_download(url, output)):
+                cmd = [
+                    _YTDLP, "--no-warnings", "--no-check-certificates",
+                    "--concurrent-fragments", str(self.fragments),
+                    "-o", str(output), url,
+                ]
+                _run_tool(cmd)
+
+            size = _file_size(output)
+            if size > 1000:
+                # yt-dlp may have succeeded after a ranged false start —
+                # drop any leftover resume state
+                for leftover in (output.with_name(output.name + ".part"),
+                                 output.with_name(output.name + ".meta")):
+                    try:
+                        leftover.unlink()
+                    except OSError:
+                        pass
+                print(f" {size / 1024 / 1024:.1f} MB")
+                self._bump("downloaded")
                 return
 
             # Download failed — wait for network and retry
@@ -1034,10 +2181,19 @@ class UdemyDownloader:
                     break
 
         print(" FAILED")
-        self.stats["failed"] += 1
+        self._bump("failed")
 
-    def _dl_drm(self, media_sources, output, num, title, lecture_id=None):
+    def _dl_drm(self, media_sources, output, num, title, lecture_id=None,
+                curriculum_token=None):
         """Download DRM-protected video: get keys -> download -> decrypt."""
+        # _download_video filters existing outputs, but guard here too —
+        # one stat is nothing next to the token fetch, downloads, and
+        # ffmpeg spawn this skips for any other caller
+        if _file_size(output) > 1000:
+            print(f"  [{num:03d}] {title} - EXISTS")
+            self._bump("skipped")
+            return
+
         # Find DASH/MPD source
         mpd_url = None
         for src in media_sources:
@@ -1053,19 +2209,41 @@ class UdemyDownloader:
 
         if not mpd_url:
             print(f"  [{num:03d}] {title} - No DASH source")
-            self.stats["failed"] += 1
+            self._bump("failed")
             return
 
         if not self.drm.available:
             print(f"  [{num:03d}] {title} - DRM (no CDM available)")
-            self.stats["failed"] += 1
+            self._bump("failed")
             return
 
+        # A chapter prefetch (or an earlier attempt at this lecture) may
+        # already hold a token still inside its validity window — the
+        # TTL check below is what gates reuse, so entries stay in the
+        # map rather than being popped
+        license_token = None
+        prefetched = self._fresh_tokens.get(lecture_id) if lecture_id else None
+        if prefetched:
+            token, fresh_mpd, fetched_at = prefetched
+            if time.time() - fetched_at < LICENSE_TOKEN_TTL:
+                license_token = token
+                if fresh_mpd:
+                    mpd_url = fresh_mpd
+        # The curriculum payload carries a token too; usable only while
+        # the payload itself is younger than the token TTL (a curriculum
+        # served from the 6-hour disk cache is long past it)
+        if (license_token is None and curriculum_token
+                and time.time() - self._curriculum_fetched_at
+                < LICENSE_TOKEN_TTL):
+            license_token = curriculum_token
+        prefetch_hit = license_token is not None
+
         # Fetch FRESH license token per-lecture (tokens expire in ~3-5 min)
         # Retry up to 5 times with network wait on failure
-        license_token = None
         max_token_retries = 5
         for _token_attempt in range(max_token_retries):
+            if license_token:
+                break
             if lecture_id and self.course_id:
                 try:
                     url = (
@@ -1114,16 +2292,30 @@ class UdemyDownloader:
 
         if not license_token:
             print(f"  [{num:03d}] {title} - DRM (no license token after {max_token_retries} attempts)")
-            self.stats["failed"] += 1
+            self._bump("failed")
             return
 
+        # Cache freshly issued tokens so retries and fallbacks within
+        # the TTL window skip the license API round-trip
+        if lecture_id and not prefetch_hit:
+            self._fresh_tokens[lecture_id] = (
+                license_token, mpd_url, time.time()
+            )
+
         print(f"  [{num:03d}] {title} (DRM)...")
 
         # Step 1: Get decryption keys (with network retry)
+        mpd_cache = None
+        if lecture_id and self.course_id:
+            mpd_cache = (
+                SCRIPT_DIR / ".cache" / str(self.course_id)
+                / f"mpd_{lecture_id}.xml"
+            )
         keys = None
         for _key_attempt in range(3):
             print("         Getting keys...", end="", flush=True)
-            keys = self.drm.get_keys(self.session, mpd_url, license_token)
+            keys = self.drm.get_keys(self.session, mpd_url, license_token,
+                                     mpd_cache=mpd_cache)
             if keys:
                 print(f" OK ({len(keys)} key(s))")
                 break
@@ -1136,68 +2328,120 @@ class UdemyDownloader:
                 else:
                     break
         if not keys:
-            self.stats["failed"] += 1
+            self._bump("failed")
             return
 
-        # Step 2: Download encrypted streams (with network retry)
-        tmpdir = tempfile.mkdtemp(prefix="udl_")
-        try:
-            video_file = None
-            audio_file = None
-            for _dl_attempt in range(3):
-                enc_v = os.path.join(tmpdir, "video.mp4")
-                enc_a = os.path.join(tmpdir, "audio.m4a")
-
-                print("         Downloading...", end="", flush=True)
-                subprocess.run(
+        # Step 2: Download encrypted streams (with network retry).
+        # Reuse a per-lecture dir under the shared temp root; contents are
+        # wiped after use but the directory itself persists for retries.
+        tmp_path = self._tmp_root / f"l{lecture_id or num}"
+        tmp_path.mkdir(exist_ok=True)
+        tmpdir = str(tmp_path)
+        video_file = None
+        audio_file = None
+        for _dl_attempt in range(3):
+            enc_v = os.path.join(tmpdir, "video.mp4")
+            enc_a = os.path.join(tmpdir, "audio.m4a")
+
+            print("         Downloading...", end="", flush=True)
+            if not self._dash_download(mpd_url, tmpdir, mpd_cache=mpd_cache):
+                # Manifest layout the in-process parser doesn't
+                # cover — yt-dlp understands everything. Video and
+                # audio are independent representations, so run both
+                # processes at once and wait.
+                pv = subprocess.Popen(
                     [
-                        "yt-dlp", "--no-warnings", "--allow-unplayable-formats",
+                        _YTDLP, "--no-warnings", "--allow-unplayable-formats",
                         "--no-check-certificates",
+                        "--concurrent-fragments", str(self.fragments),
                         "-f", "bestvideo", "-o", enc_v, mpd_url,
                     ],
-                    capture_output=True,
+                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
                 )
-                subprocess.run(
+                pa = subprocess.Popen(
                     [
-                        "yt-dlp", "--no-warnings", "--allow-unplayable-formats",
+                        _YTDLP, "--no-warnings", "--allow-unplayable-formats",
                         "--no-check-certificates",
+                        "--concurrent-fragments", str(self.fragments),
                         "-f", "bestaudio", "-o", enc_a, mpd_url,
                     ],
-                    capture_output=True,
-                )
-
-                video_file = next(
-                    iter(sorted(Path(tmpdir).glob("video*"))), None
-                )
-                audio_file = next(
-                    iter(sorted(Path(tmpdir).glob("audio*"))), None
+                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
                 )
+                pv.wait()
+                pa.wait()
+
+            # yt-dlp can munge the extension, so scan the directory once
+            # with a prefix check instead of two glob+sort passes. Names
+            # stay sorted so "video.mp4" wins over a leftover
+            # "video.mp4.part".
+            video_file = audio_file = None
+            try:
+                with os.scandir(tmpdir) as entries:
+                    for entry in sorted(entries, key=lambda e: e.name):
+                        name = entry.name
+                        if video_file is None and name.startswith("video"):
+                            video_file = Path(entry.path)
+                        elif audio_file is None and name.startswith("audio"):
+                            audio_file = Path(entry.path)
+                        if video_file is not None and audio_file is not None:
+                            break
+            except OSError:
+                pass
 
-                if video_file:
-                    print(" OK")
+            if video_file:
+                print(" OK")
+                break
+            print(" download failed")
+            if _dl_attempt < 2:
+                print("         Waiting for network...", end="", flush=True)
+                if wait_for_network(timeout=300):
+                    print(" restored, retrying...")
+                    # Clean partial files before retry
+                    for f in Path(tmpdir).glob("*"):
+                        f.unlink()
+                    safe_delay((2.0, 4.0))
+                else:
                     break
-                print(" download failed")
-                if _dl_attempt < 2:
-                    print("         Waiting for network...", end="", flush=True)
-                    if wait_for_network(timeout=300):
-                        print(" restored, retrying...")
-                        # Clean partial files before retry
-                        for f in Path(tmpdir).glob("*"):
-                            f.unlink()
-                        safe_delay((2.0, 4.0))
-                    else:
-                        break
 
-            if not video_file:
-                print("         Video download failed after retries")
-                self.stats["failed"] += 1
-                return
+        if not video_file:
+            print("         Video download failed after retries")
+            self._bump("failed")
+            self._wipe_tmp(tmp_path)
+            return
+
+        # Step 3 (decrypt + merge) runs on the mux pool so the next
+        # lecture's download starts while this one muxes; the pool is
+        # drained before the course summary prints
+        self._mux_pool.submit(
+            self._decrypt_and_mux, video_file, audio_file, keys,
+            output, num, title, tmp_path,
+        )
+
+    @staticmethod
+    def _wipe_tmp(tmp_path):
+        """Remove a lecture temp dir's contents, keeping the dir itself."""
+        for leftover in tmp_path.glob("*"):
+            try:
+                leftover.unlink()
+            except OSError:
+                pass
 
-            # Step 3: Decrypt + merge with ffmpeg
-            print("         Decrypting...", end="", flush=True)
-            key = keys[0][1]
+    def _decrypt_and_mux(self, video_file, audio_file, keys, output, num,
+                         title, tmp_path):
+        """Decrypt + merge one lecture with ffmpeg. Runs on the mux pool."""
+        # Mux into a .part beside the final name — a killed ffmpeg must
+        # not leave a file that passes the next run's size-based skip.
+        # Same directory keeps the final os.replace a rename. The .part
+        # name hides the container from ffmpeg, so -f mp4 is explicit.
+        stage = output.with_name(output.name + ".part")
+        try:
+            key = keys[0][1].hex()
 
-            cmd = ["ffmpeg", "-y"]
+            # Keep ffmpeg output minimal: full-verbosity stderr through a
+            # capture pipe costs real time on long inputs, and only the
+            # error tail is ever shown
+            cmd = [_FFMPEG, "-y", "-nostdin", "-loglevel", "error",
+                   "-threads", "4"]
             cmd += ["-decryption_key", key, "-i", str(video_file)]
             if audio_file:
                 cmd += ["-decryption_key", key, "-i", str(audio_file)]
@@ -1205,79 +2449,117 @@ class UdemyDownloader:
                 "-c", "copy",
                 "-movflags", "+faststart",
                 "-metadata", f"title={title}",
-                str(output),
+                "-f", "mp4",
+                str(stage),
             ]
 
-            r = subprocess.run(cmd, capture_output=True, text=True)
+            try:
+                r = _run_tool(cmd, stderr=subprocess.PIPE,
+                              timeout=DECRYPT_TIMEOUT)
+            except subprocess.TimeoutExpired:
+                print(f"  [{num:03d}] {title} - decrypt timed out, killed")
+                self._bump("failed")
+                return
 
-            if output.exists() and output.stat().st_size > 1000:
-                sz = output.stat().st_size / 1024 / 1024
-                print(f" OK ({sz:.1f} MB)")
-                self.stats["downloaded"] += 1
+            size = _file_size(stage)
+            if size > 1000:
+                os.replace(stage, output)
+                print(f"  [{num:03d}] {title} - decrypted OK "
+                      f"({size / 1024 / 1024:.1f} MB)")
+                self._bump("downloaded")
             else:
                 # Try with Shaka Packager as fallback
-                if shutil.which("packager"):
-                    print(" ffmpeg failed, trying Shaka...")
+                if _PACKAGER:
+                    print(f"  [{num:03d}] {title} - ffmpeg failed, trying Shaka...")
                     self._decrypt_shaka(
                         video_file, audio_file, keys, output, title
                     )
                 else:
-                    print(" FAILED")
+                    print(f"  [{num:03d}] {title} - decrypt FAILED")
                     if r.stderr:
                         print(f"         {r.stderr[-200:]}")
-                    self.stats["failed"] += 1
+                    self._bump("failed")
+        except Exception as e:
+            # The pool's shutdown(wait=True) discards worker exceptions,
+            # so anything unhandled here would vanish and the summary
+            # would over-report success
+            print(f"  [{num:03d}] {title} - decrypt error: {e}")
+            self._bump("failed")
         finally:
-            shutil.rmtree(tmpdir, ignore_errors=True)
+            try:
+                stage.unlink()
+            except OSError:
+                pass
+            self._wipe_tmp(tmp_path)
 
     def _decrypt_shaka(self, video_file, audio_file, keys, output, title):
         """Fallback decryption using Shaka Packager."""
         tmpdir2 = tempfile.mkdtemp(prefix="udl_dec_")
+        stage = output.with_name(output.name + ".part")
         try:
             kid, key = keys[0]
-            key_arg = f"key_id={kid}:key={key}"
+            key_arg = f"key_id={kid.hex()}:key={key.hex()}"
             dec_v = os.path.join(tmpdir2, "dec_video.mp4")
             dec_a = os.path.join(tmpdir2, "dec_audio.m4a")
 
+            # packager takes multiple input= descriptors in one argv and
+            # decrypts the streams on its own worker threads — one
+            # fork/exec instead of one per stream
+            streams = []
             if video_file:
-                subprocess.run(
-                    [
-                        "packager",
-                        f"input={video_file},stream=video,output={dec_v}",
-                        "--enable_raw_key_decryption",
-                        "--keys", key_arg,
-                    ],
-                    capture_output=True,
-                )
-
+                streams.append(f"input={video_file},stream=video,output={dec_v}")
             if audio_file:
-                subprocess.run(
-                    [
-                        "packager",
-                        f"input={audio_file},stream=audio,output={dec_a}",
-                        "--enable_raw_key_decryption",
-                        "--keys", key_arg,
-                    ],
-                    capture_output=True,
-                )
+                streams.append(f"input={audio_file},stream=audio,output={dec_a}")
+            if streams:
+                try:
+                    _run_tool(
+                        [_PACKAGER] + streams
+                        + ["--enable_raw_key_decryption", "--keys", key_arg],
+                        timeout=DECRYPT_TIMEOUT,
+                    )
+                except subprocess.TimeoutExpired:
+                    print("         Shaka timed out, killed")
+                    self._bump("failed")
+                    return
 
-            cmd = ["ffmpeg", "-y"]
             dv = dec_v if os.path.exists(dec_v) else None
             da = dec_a if os.path.exists(dec_a) else None
-            if dv:
-                cmd += ["-i", dv]
-            if da:
-                cmd += ["-i", da]
-            cmd += ["-c", "copy", "-movflags", "+faststart", str(output)]
-            subprocess.run(cmd, capture_output=True)
-
-            if output.exists() and output.stat().st_size > 1000:
-                sz = output.stat().st_size / 1024 / 1024
-                print(f"         Shaka OK ({sz:.1f} MB)")
-                self.stats["downloaded"] += 1
+            if dv and not da:
+                # Nothing to merge: packager already wrote a playable
+                # MP4, so moving it into place beats a full-size ffmpeg
+                # read+rewrite that would only relocate the moov atom.
+                # Stage first — the temp dir may sit on another
+                # filesystem, making this a copy rather than a rename.
+                shutil.move(dv, stage)
+            else:
+                cmd = [_FFMPEG, "-y", "-nostdin", "-loglevel", "error",
+                       "-threads", "4"]
+                if dv:
+                    cmd += ["-i", dv]
+                if da:
+                    cmd += ["-i", da]
+                cmd += ["-c", "copy", "-movflags", "+faststart",
+                        "-f", "mp4", str(stage)]
+                try:
+                    _run_tool(cmd, timeout=DECRYPT_TIMEOUT)
+                except subprocess.TimeoutExpired:
+                    print("         Shaka merge timed out, killed")
+                    self._bump("failed")
+                    return
+
+            size = _file_size(stage)
+            if size > 1000:
+                os.replace(stage, output)
+                print(f"         Shaka OK ({size / 1024 / 1024:.1f} MB)")
+                self._bump("downloaded")
             else:
                 print("         Shaka also failed")
-                self.stats["failed"] += 1
+                self._bump("failed")
         finally:
+            try:
+                stage.unlink()
+            except OSError:
+                pass
             shutil.rmtree(tmpdir2, ignore_errors=True)
 
     # ── Article Download ──────────────────────────────────────────
@@ -1287,13 +2569,15 @@ class UdemyDownloader:
         output = chapter_dir / f"{num:03d} {safe_title}.html"
 
         if output.exists():
-            self.stats["skipped"] += 1
+            self._bump("skipped")
             return
 
         body = asset.get("body", "")
 
-        # If body is empty, fetch it via per-lecture API
-        if not body and lecture_id and self.course_id:
+        # If body is empty, fetch it via per-lecture API — unless a
+        # previous run already found this lecture's article empty
+        if (not body and lecture_id and self.course_id
+                and lecture_id not in self._empty_articles):
             try:
                 url = (
                     f"https://{self.portal}.udemy.com/api-2.0/users/me/"
@@ -1309,19 +2593,14 @@ class UdemyDownloader:
                 pass
 
         if body:
-            html = (
-                f"<!DOCTYPE html><html><head>"
-                f"<meta charset='utf-8'>"
-                f"<title>{title}</title>"
-                f"<style>body{{font-family:sans-serif;max-width:800px;"
-                f"margin:40px auto;padding:0 20px;line-height:1.6}}</style>"
-                f"</head><body><h1>{title}</h1>{body}</body></html>"
-            )
-            output.write_text(html, encoding="utf-8")
+            html = _ARTICLE_HEAD.format(title=title) + body + _ARTICLE_TAIL
+            _atomic_write(output, html.encode("utf-8"))
             sz = len(html) / 1024
             print(f"  [{num:03d}] {title} - Article ({sz:.0f} KB)")
-            self.stats["downloaded"] += 1
+            self._bump("downloaded")
         else:
+            if lecture_id:
+                self._empty_articles.add(lecture_id)
             print(f"  [{num:03d}] {title} - Article (no content)")
 
     # ── Caption/Subtitle Download ─────────────────────────────────
@@ -1340,52 +2619,85 @@ class UdemyDownloader:
             return
 
         try:
-            r = self.session.get(url)
+            # Auto-generated VTTs on long lectures reach megabytes —
+            # stream into the .part file rather than buffering the body
+            try:
+                r = self.session.get(url, stream=True)
+            except TypeError:
+                r = self.session.get(url)
             if r.status_code == 200:
-                out_vtt.write_bytes(r.content)
+                part = out_vtt.with_suffix(out_vtt.suffix + ".part")
+                try:
+                    with open(part, "wb") as f:
+                        for chunk in r.iter_content(chunk_size=STREAM_CHUNK):
+                            f.write(chunk)
+                except (AttributeError, TypeError):
+                    part.write_bytes(r.content)
+                finally:
+                    if hasattr(r, "close"):
+                        r.close()
+                os.replace(part, out_vtt)
                 self._vtt_to_srt(out_vtt, out_srt)
         except Exception:
             pass
 
     def _vtt_to_srt(self, vtt_path, srt_path):
-        """Simple VTT to SRT conversion."""
-        try:
-            text = vtt_path.read_text(encoding="utf-8")
-            text = re.sub(r"WEBVTT.*?\n\n", "", text, flags=re.DOTALL)
-            text = re.sub(r"STYLE\s*\n.*?\n\n", "", text, flags=re.DOTALL)
-            text = re.sub(r"NOTE\s*\n.*?\n\n", "", text, flags=re.DOTALL)
+        """Simple VTT to SRT conversion.
 
-            blocks = re.split(r"\n\n+", text.strip())
-            srt_blocks = []
+        One streaming pass over the file. The old version ran three
+        DOTALL rewrites plus a split across the whole text, each
+        reallocating the full buffer — auto-generated VTTs reach
+        megabytes on long courses.
+        """
+        import io
+
+        try:
+            # Cues go straight into one StringIO (amortized O(1) growth)
+            # instead of a per-cue f-string + list + final join
+            buf = io.StringIO()
             idx = 1
+            ts_line = None
+            text_lines = []
+            skip_block = False
 
-            for block in blocks:
-                lines = block.strip().split("\n")
-                if not lines:
-                    continue
+            def flush():
+                nonlocal idx, ts_line, text_lines, skip_block
+                if ts_line and text_lines:
+                    buf.write(f"{idx}\n")
+                    buf.write(ts_line)
+                    buf.write("\n")
+                    buf.write("\n".join(text_lines))
+                    buf.write("\n\n")
+                    idx += 1
                 ts_line = None
                 text_lines = []
-                for line in lines:
-                    if "-->" in line:
-                        ts_line = line.replace(".", ",")
-                        ts_line = re.sub(
-                            r"\s+(position|align|line|size|vertical):.*",
-                            "", ts_line,
-                        )
+                skip_block = False
+
+            with open(vtt_path, "r", encoding="utf-8") as f:
+                for raw in f:
+                    line = raw.rstrip("\r\n")
+                    if not line.strip():
+                        flush()  # blank line ends the current block
+                    elif skip_block:
+                        continue
+                    elif "-->" in line:
+                        ts_line = _CUE_SETTINGS_RE.sub(
+                            "", line.replace(".", ","))
                     elif ts_line is not None:
-                        clean = re.sub(r"<[^>]+>", "", line)
+                        # most cue lines carry no markup — skip the
+                        # regex engine entirely for those
+                        clean = _TAG_RE.sub("", line) if "<" in line else line
                         if clean.strip():
                             text_lines.append(clean)
-                if ts_line and text_lines:
-                    srt_blocks.append(
-                        f"{idx}\n{ts_line}\n" + "\n".join(text_lines)
-                    )
-                    idx += 1
-
-            if srt_blocks:
-                srt_path.write_text(
-                    "\n\n".join(srt_blocks) + "\n", encoding="utf-8"
-                )
+                    elif line.startswith(("WEBVTT", "STYLE", "NOTE")):
+                        skip_block = True
+                    # anything else is a cue identifier — dropped
+            flush()
+
+            srt = buf.getvalue()
+            if srt:
+                # trim the second trailing newline left by the last block
+                _atomic_write(srt_path, srt[:-1].encode("utf-8"))
         except Exception:
             pass
 
@@ -1417,11 +2729,29 @@ class UdemyDownloader:
             return
 
         try:
-            r = self.session.get(url)
+            # Stream to the .part file instead of buffering the body —
+            # supplements can be large (zips, PDFs) and several download
+            # at once on the asset pool
+            try:
+                r = self.session.get(url, stream=True)
+            except TypeError:
+                r = self.session.get(url)
             if r.status_code == 200:
-                out.write_bytes(r.content)
-                sz = len(r.content) / 1024
-                print(f"         + {safe_fn} ({sz:.0f} KB)")
+                part = out.with_suffix(out.suffix + ".part")
+                size = 0
+                try:
+                    with open(part, "wb") as f:
+                        for chunk in r.iter_content(chunk_size=STREAM_CHUNK):
+                            f.write(chunk)
+                            size += len(chunk)
+                except (AttributeError, TypeError):
+                    part.write_bytes(r.content)
+                    size = len(r.content)
+                finally:
+                    if hasattr(r, "close"):
+                        r.close()
+                os.replace(part, out)
+                print(f"         + {safe_fn} ({size / 1024:.0f} KB)")
         except Exception:
             pass
 
@@ -1524,17 +2854,8 @@ def _categorize_csv_file(csv_file, api_key):
             "messages": [{"role": "user", "content": prompt}],
             "temperature": 0,
         }).encode()
-        req = urllib.request.Request(
-            "https://api.openai.com/v1/chat/completions",
-            data=payload,
-            headers={
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {api_key}",
-            },
-        )
         try:
-            with urllib.request.urlopen(req, timeout=90) as resp:
-                data = json.loads(resp.read())
+            data = json.loads(_openai_post(payload, api_key))
             content = data["choices"][0]["message"]["content"].strip()
             if content.startswith("```"):
                 content = re.sub(r"^```\w*\n?", "", content)
@@ -1550,30 +2871,38 @@ def _categorize_csv_file(csv_file, api_key):
             print(f"\n  OpenAI API error: {e}")
             return {}
 
-    # Process in batches of 30
+    # Process in batches of 30 — same concurrent shape as
+    # UdemyDownloader.categorize_courses: a few batches in flight with
+    # a shared throttle holding the old request pacing
     batch_size = 30
-    for start in range(0, len(to_categorize), batch_size):
-        batch_indices = to_categorize[start:start + batch_size]
-        titles = [rows[idx][col["title"]] for idx in batch_indices]
-        done = min(start + batch_size, len(to_categorize))
-        print(f"  Categorizing: {done}/{len(to_categorize)}...", end="\r", flush=True)
+    batches = [to_categorize[i:i + batch_size]
+               for i in range(0, len(to_categorize), batch_size)]
+    throttle = threading.Lock()
 
-        result = call_openai(titles)
-        for j, row_idx in enumerate(batch_indices):
-            cat, sub = result.get(j, ("Other", ""))
-            rows[row_idx][col["cat"]] = cat
-            rows[row_idx][col["sub"]] = sub
+    def categorize(batch_indices):
+        with throttle:
+            time.sleep(0.5)
+        titles = [rows[idx][col["title"]] for idx in batch_indices]
+        return batch_indices, call_openai(titles)
 
-        time.sleep(0.5)
+    done = 0
+    progress = _ProgressPrinter()
+    with ThreadPoolExecutor(max_workers=min(3, len(batches))) as pool:
+        for batch_indices, result in pool.map(categorize, batches):
+            for j, row_idx in enumerate(batch_indices):
+                cat, sub = result.get(j, ("Other", ""))
+                rows[row_idx][col["cat"]] = cat
+                rows[row_idx][col["sub"]] = sub
+            done += len(batch_indices)
+            progress.update(f"  Categorizing: {done}/{len(to_categorize)}...")
 
-    print(f"  Categorization complete!" + " " * 30)
+    progress.done(f"  Categorization complete!" + " " * 30)
 
     # Write updated CSV
     with open(csv_path, "w", newline="", encoding="utf-8-sig") as f:
         writer = csv.writer(f)
         writer.writerow(headers)
-        for row in rows:
-            writer.writerow(row)
+        writer.writerows(rows)
 
     print(f"  Saved CSV: {csv_path}")
 
@@ -1948,6 +3277,15 @@ def main():
         "-q", "--quality", type=int, default=1080,
         help="Max video quality in pixels (default: 1080)",
     )
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=1,
+        help="Parallel lecture downloads per chapter (default: 1; "
+             "higher values are faster but less gentle on your account)",
+    )
+    parser.add_argument(
+        "--fragments", type=int, default=4,
+        help="Concurrent DASH fragments per yt-dlp download (default: 4)",
+    )
     parser.add_argument(
         "--chapters", help="Chapter filter, e.g. '1,3-5,7'"
     )
@@ -2003,9 +3341,9 @@ def main():
 
     # Check dependencies
     missing = []
-    for cmd in ("ffmpeg", "yt-dlp"):
-        if not shutil.which(cmd):
-            missing.append(cmd)
+    for name, resolved in (("ffmpeg", _FFMPEG), ("yt-dlp", _YTDLP)):
+        if not os.path.isabs(resolved):
+            missing.append(name)
     if missing:
         print(f"ERROR: Missing required tools: {', '.join(missing)}")
         print("Install them and make sure they're in PATH.")
@@ -2020,7 +3358,8 @@ def main():
     print(f" OK (bearer: {'yes' if session.bearer else 'no'})")
 
     # Create downloader
-    dl = UdemyDownloader(session, args.output, args.quality)
+    dl = UdemyDownloader(session, args.output, args.quality, jobs=args.jobs,
+                         fragments=args.fragments)
 
     if args.list:
         oai_key = args.api_key or os.environ.get("OPENAI_API_KEY")